@@ -1,15 +1,36 @@
-from gcp_pal.bigquery import BigQuery
-from gcp_pal.cloudfunctions import CloudFunctions
-from gcp_pal.cloudrun import CloudRun
-from gcp_pal.cloudscheduler import CloudScheduler
-from gcp_pal.firestore import Firestore
-from gcp_pal.pubsub import PubSub
-from gcp_pal.pylogging import Logging
-from gcp_pal.request import Request
-from gcp_pal.schema import Schema
-from gcp_pal.storage import Storage
-from gcp_pal.storage import Parquet
-from gcp_pal.secretmanager import SecretManager
-from gcp_pal.project import Project
-from gcp_pal.dataplex import Dataplex
-from gcp_pal.artifactregistry import ArtifactRegistry
+import importlib
+
+# Each public class is imported from its module on first access (PEP 562), so that
+# `import gcp_pal` doesn't pay for the import of every service module up front.
+_LAZY_IMPORTS = {
+    "BigQuery": "gcp_pal.bigquery",
+    "CloudFunctions": "gcp_pal.cloudfunctions",
+    "CloudRun": "gcp_pal.cloudrun",
+    "CloudScheduler": "gcp_pal.cloudscheduler",
+    "Firestore": "gcp_pal.firestore",
+    "PubSub": "gcp_pal.pubsub",
+    "Logging": "gcp_pal.pylogging",
+    "Request": "gcp_pal.request",
+    "Schema": "gcp_pal.schema",
+    "Storage": "gcp_pal.storage",
+    "Parquet": "gcp_pal.storage",
+    "SecretManager": "gcp_pal.secretmanager",
+    "Project": "gcp_pal.project",
+    "Dataplex": "gcp_pal.dataplex",
+    "ArtifactRegistry": "gcp_pal.artifactregistry",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'gcp_pal' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import os
+import copy
+import time
+import uuid
+import datetime
+import functools
+import itertools
+import collections
 from gcp_pal.utils import try_import
 
 from gcp_pal.schema import (
     Schema,
     dict_to_bigquery_fields,
-    dict_to_bigquery_fields,
     bigquery_fields_to_dict,
 )
 from gcp_pal.utils import (
@@ -19,104 +25,448 @@ from gcp_pal.utils import (
 )
 
 
+def _create_bigquery_client(**kwargs):
+    """
+    Create a BigQuery client with an enlarged HTTP connection pool.
+
+    The default urllib3 pool holds 10 connections, so concurrent queries and inserts on a
+    shared client keep discarding and re-opening TLS connections. This is passed to
+    `ClientHandler`, so the adapter is mounted once per cached client.
+
+    Args:
+    - kwargs: The arguments to pass to `bigquery.Client`. E.g. `project="my-project"`.
+
+    Returns:
+    - bigquery.Client: The client.
+    """
+    bigquery = ModuleHandler("google.cloud").please_import(
+        "bigquery", who_is_calling="BigQuery"
+    )
+    adapters = ModuleHandler("requests").please_import(
+        "adapters", who_is_calling="BigQuery"
+    )
+    client = bigquery.Client(**kwargs)
+    adapter = adapters.HTTPAdapter(
+        pool_connections=128, pool_maxsize=128, max_retries=3
+    )
+    try:
+        client._http.mount("https://", adapter)
+        client._http._auth_request.session.mount("https://", adapter)
+    except AttributeError:
+        pass
+    return client
+
+
+# Standard SQL types of query parameters. bool and datetime come before their
+# base classes int and date for the isinstance fallback in _bq_param_type.
+_PY_TO_BQ = {
+    bool: "BOOL",
+    int: "INT64",
+    float: "FLOAT64",
+    str: "STRING",
+    bytes: "BYTES",
+    datetime.datetime: "TIMESTAMP",
+    datetime.date: "DATE",
+}
+
+
+# Column types used by _infer_partitioning
+_PARTITION_TYPES = {"DATE", "DATETIME", "TIMESTAMP"}
+_CLUSTER_TYPES = {"STRING", "INTEGER", "INT64"}
+
+
+def _storage_write_value(value, as_string):
+    """
+    Prepare a row value for the Storage Write API. Only the scalars `json.dumps`
+    encodes are accepted, as in `insert_rows_json`, so values such as datetimes or
+    numpy integers are rejected whatever the size of the batch.
+
+    Args:
+    - value: The row value.
+    - as_string (bool): Whether the field is sent in its string form, e.g. DATE.
+
+    Returns:
+    - The value to set on the row message.
+    """
+    if not isinstance(value, (str, int, float)):
+        type_name = type(value).__name__
+        raise TypeError(f"Object of type {type_name} is not JSON serializable")
+    if as_string and not isinstance(value, str):
+        if isinstance(value, bool):
+            raise TypeError("Booleans are not sent in string form")
+        return str(value)
+    return value
+
+
+def _bq_to_arrow_schema(schema):
+    """
+    Convert a BigQuery schema to the Arrow schema BigQuery results are downloaded with.
+
+    Args:
+    - schema (list of bigquery.SchemaField): The BigQuery schema.
+
+    Returns:
+    - pyarrow.Schema: The Arrow schema.
+    """
+    # The helper used by `RowIterator.to_arrow`, if this version of the client has it
+    helpers = try_import(
+        "google.cloud.bigquery._pandas_helpers", "BigQuery", errors="ignore"
+    )
+    bq_to_arrow_schema = getattr(helpers, "bq_to_arrow_schema", None)
+    arrow_schema = bq_to_arrow_schema(schema) if bq_to_arrow_schema else None
+    if arrow_schema is None:
+        arrow_schema = Schema(schema).pyarrow()
+    return arrow_schema
+
+
+def _bq_param_type(value):
+    """
+    Get the BigQuery type of a query parameter value. Unknown types are sent as STRING.
+
+    Examples:
+    - `_bq_param_type(1)` -> "INT64"
+    - `_bq_param_type(True)` -> "BOOL"
+    """
+    val_type = _PY_TO_BQ.get(type(value))
+    if val_type is not None:
+        return val_type
+    for py_type, val_type in _PY_TO_BQ.items():
+        if isinstance(value, py_type):
+            return val_type
+    return "STRING"
+
+
+def _infer_partitioning(schema):
+    """
+    Pick partitioning and clustering columns from a table schema.
+
+    Args:
+    - schema (list of bigquery.SchemaField): The table schema.
+
+    Returns:
+    - tuple: (time_partition_col, cluster_cols). The first top-level DATE/DATETIME/TIMESTAMP column
+             (or None), and up to 4 leading STRING/INTEGER columns.
+    """
+    time_partition_col = None
+    cluster_cols = []
+    for field in schema:
+        if field.mode == "REPEATED":
+            continue
+        field_type = field.field_type.upper()
+        if time_partition_col is None and field_type in _PARTITION_TYPES:
+            time_partition_col = field.name
+        elif field_type in _CLUSTER_TYPES and len(cluster_cols) < 4:
+            cluster_cols.append(field.name)
+    return time_partition_col, cluster_cols or None
+
+
+def _restriction_literal(value):
+    """
+    Format a filter value as a literal for a Storage Read API row restriction.
+
+    Returns:
+    - str: The literal, or None if the value type is not supported.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{escaped}'"
+    return None
+
+
+def _parse_fqn(table=None, dataset=None, project=None):
+    """
+    Split a (partially) qualified table or dataset name into its project, dataset and table.
+
+    Args:
+    - table (str): Table name, "dataset.table" or "project.dataset.table".
+    - dataset (str): Dataset name, or "project.dataset" if no project is given.
+    - project (str): Project ID. If given, the table may not include a project.
+
+    Returns:
+    - tuple: (project, dataset, table). The project is None if it could not be determined.
+
+    Examples:
+    - `_parse_fqn("project.dataset.table")` -> ("project", "dataset", "table")
+    - `_parse_fqn("dataset.table", project="project")` -> ("project", "dataset", "table")
+    - `_parse_fqn(dataset="project.dataset")` -> ("project", "dataset", None)
+    """
+    parts = table.split(".") if table else [table]
+    if len(parts) == 3 and not project:
+        project, dataset, table = parts
+    elif len(parts) == 2:
+        dataset, table = parts
+    elif len(parts) != 1:
+        raise ValueError("Table name cannot contain '.'")
+    if dataset and not project and "." in dataset:
+        project, dataset = dataset.split(".", 1)
+    return project, dataset, table
+
+
+class _QueryForLog:
+    """
+    A query with its parameters, rendered for the logs only when the log message is built.
+    """
+
+    __slots__ = ("sql", "params")
+    max_length = 200
+
+    def __init__(self, sql, params=None):
+        self.sql = sql
+        self.params = params or {}
+
+    def __str__(self):
+        sql = self.sql
+        # Longest names first, so that "@param_1" doesn't replace the start of "@param_10"
+        for key in sorted(self.params, key=len, reverse=True):
+            sql = sql.replace(f"@{key}", str(self.params[key]))
+        if len(sql) > self.max_length:
+            sql = sql[: self.max_length] + "..."
+        return sql
+
+
 class SQLBuilder:
     """
     Class for safely building SQL queries for use with Google BigQuery.
+
+    Filters are sorted by column and operator before parameter names are assigned, so
+    logically identical queries always produce identical SQL text. This lets BigQuery
+    serve repeated reads from its result cache.
     """
 
     ALLOWED_OPERATIONS = {"=", ">", "<", ">=", "<=", "IN", "LIKE"}
+    # Lists longer than this are bound as one array parameter: `col` IN UNNEST(@param_0)
+    MAX_INLINE_VALUES = 32
 
     def __init__(self, table_name: str):
         self.table_name = table_name
-        self.query_parts = ["FROM", f"`{table_name}`"]
-        self.parameters = {}  # Holds parameters to prevent SQL injection
+        self.reset()
 
-    def build(self) -> str:
+    def reset(self) -> "SQLBuilder":
         """
-        Return the final query string and parameters.
+        Clear all clauses and parameters, so the builder can be reused for a new query.
         """
-        sql_query = " ".join(self.query_parts), self.parameters
+        self._select = "SELECT *"
+        self._where_clause = ""
+        self._limit_clause = ""
+        self._union = ""
+        self.parameters = {}  # Holds parameters to prevent SQL injection
+        return self
 
-        # Reset query parts and parameters
-        self.query_parts = ["FROM", f"`{self.table_name}`"]
-        self.parameters = {}
-        return sql_query
+    def build(self) -> tuple[str, dict]:
+        """
+        Return the final query string and parameters. The builder state is left unchanged.
+        """
+        if self._union:
+            sql = f"{self._union}{self._limit_clause}"
+        else:
+            sql = (
+                f"{self._select} FROM `{self.table_name}`"
+                f"{self._where_clause}{self._limit_clause}"
+            )
+        # Deterministic text and parameter order keep repeated reads eligible for the query cache
+        return sql, dict(sorted(self.parameters.items()))
 
     def select(self, columns=None) -> "SQLBuilder":
         """
         Build a SELECT query.
         """
-        if columns is None:
-            columns = "*"
-        if isinstance(columns, str):
-            columns = [columns]
-        columns = [f"`{x}`" for x in columns if x != "*"] or ["*"]
-        select_clause = "SELECT " + ", ".join(columns)
-        self.query_parts.insert(0, select_clause)  # Insert at the beginning
+        self._select = self._select_clause(columns)
         return self
 
     def where(self, filters: list[tuple]) -> "SQLBuilder":
         """
         Build a WHERE clause with safe parameter handling.
         """
+        self._where_clause = ""
+        self.parameters = {}
         if not filters:
             return self
 
-        where_clause, params = self._where(filters)
+        where_clause, params = self._where(self._sort_filters(filters))
         if where_clause:
-            self.query_parts.append("WHERE " + where_clause)
-            self.parameters.update(params)
+            self._where_clause = f" WHERE {where_clause}"
+            self.parameters = params
+        return self
+
+    @classmethod
+    def build_cached(
+        cls, table_name: str, columns=None, filters=None, limit=None
+    ) -> tuple[str, dict]:
+        """
+        Equivalent to `SQLBuilder(table_name).select(columns).where(filters).limit(limit).build()`,
+        but the SQL text is cached per query shape, so repeated reads with different filter values
+        only bind the new values.
+
+        Examples:
+        - `SQLBuilder.build_cached("dataset.table", "a", [("a", ">", 1)])`
+            -> ("SELECT `a` FROM `dataset.table` WHERE `a` > @param_0", {"param_0": 1})
+        """
+        builder = cls(table_name)
+        filters = builder._check_illegal_filters(builder._sort_filters(filters or []))
+        max_inline = cls.MAX_INLINE_VALUES
+        shape = tuple(
+            (col, op, min(len(value), max_inline + 1))
+            if isinstance(value, list)
+            else (col, op, None)
+            for col, op, value in filters
+        )
+        if isinstance(columns, list):
+            columns = tuple(columns)
+        sql, param_names = cls.template(table_name, columns, shape, limit)
+        values = [
+            x
+            for _, _, value in filters
+            for x in (
+                value
+                if isinstance(value, list) and len(value) <= max_inline
+                else [value]
+            )
+        ]
+        return sql, dict(sorted(zip(param_names, values)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def template(table_name: str, columns, filter_shape: tuple, limit) -> tuple:
+        """
+        Build the SQL text for a query shape. Results are cached.
+
+        Args:
+        - table_name (str): The table to query.
+        - columns (str | tuple): Columns to select.
+        - filter_shape (tuple): `(column, operator, n_values)` per filter, in sorted order.
+                                `n_values` is the list length for list values, and None otherwise.
+        - limit (int): Limit the number of rows to return.
+
+        Returns:
+        - tuple: (sql, param_names), with the parameter names in the order of the flattened filter values.
+        """
+        filters = [
+            (col, op, [None] * n_values if n_values is not None else None)
+            for col, op, n_values in filter_shape
+        ]
+        if isinstance(columns, tuple):
+            columns = list(columns)
+        builder = SQLBuilder(table_name).select(columns).where(filters).limit(limit)
+        return builder.build()[0], tuple(builder.parameters)
+
+    def union_all(self, filters_list: list[list[tuple]], columns=None) -> "SQLBuilder":
+        """
+        Build one query that reads several filter sets at once, combined with UNION ALL.
+        Each row is tagged with a `__batch` column holding the index of its filter set.
+
+        Args:
+        - filters_list (list[list[tuple]]): The filter sets, one per batch.
+        - columns (list): Columns to select.
+
+        Examples:
+        - `SQLBuilder("dataset.table").union_all([[("a", "=", 1)], [("a", "=", 2)]]).build()`
+            -> "SELECT *, 0 AS __batch FROM `dataset.table` WHERE `a` = @b0_param_0 UNION ALL
+                SELECT *, 1 AS __batch FROM `dataset.table` WHERE `a` = @b1_param_0"
+        """
+        select_clause = self._select_clause(columns)
+        queries = [None] * len(filters_list)
+        for k, filters in enumerate(filters_list):
+            query = f"{select_clause}, {k} AS __batch FROM `{self.table_name}`"
+            if filters:
+                # Namespace the parameters by batch so they don't collide
+                where_clause, params = self._where(
+                    self._sort_filters(filters), prefix=f"b{k}_"
+                )
+                query = f"{query} WHERE {where_clause}"
+                self.parameters.update(params)
+            queries[k] = query
+        self._union = " UNION ALL ".join(queries)
         return self
 
     def limit(self, limit: int) -> "SQLBuilder":
         """
         Build a LIMIT clause.
         """
+        self._limit_clause = ""
         if limit is not None and isinstance(limit, int) and limit > 0:
-            self.query_parts.append(f"LIMIT {limit}")
+            self._limit_clause = f" LIMIT {limit}"
         return self
 
-    def _where(self, filters: list[tuple]) -> tuple:
+    def _select_clause(self, columns=None) -> str:
+        """
+        Helper to build a SELECT clause.
+        """
+        if columns is None:
+            columns = "*"
+        if isinstance(columns, str):
+            columns = [columns]
+        columns = [f"`{x}`" for x in columns if x != "*"] or ["*"]
+        return "SELECT " + ", ".join(columns)
+
+    def _sort_filters(self, filters: list) -> list[tuple]:
+        """
+        Helper to put filters in a canonical order, so that identical queries produce identical SQL.
+        """
+        return sorted(
+            (self._filter_to_tuple(f) for f in filters),
+            key=lambda f: (f[0], f[1].upper()),
+        )
+
+    def _filter_to_tuple(self, filter) -> tuple:
+        """
+        Helper to convert a filter to the form `(column, operator, value)`.
+        """
+        if isinstance(filter, dict):
+            col, value = next(iter(filter.items()))
+            return col, "IN", value
+        return tuple(filter)
+
+    def _where(self, filters: list[tuple], prefix: str = "") -> tuple:
         """
         Helper to build a WHERE clause safely.
+
+        Args:
+        - filters (list[tuple]): The filters to apply.
+        - prefix (str): Prefix for the parameter names, e.g. "b0_" -> "@b0_param_0".
         """
-        conditions = []
+        filters = self._check_illegal_filters(filters)
+        conditions = [None] * len(filters)
         params = {}
-        for i, filter in enumerate(filters):
-            if isinstance(filter, dict):
-                col, value = list(filter.items())[0]
-                op = "IN"
-            else:
-                col, op, value = filter
-            self._check_illegal_filters(col, op, value)
-            param_name = f"param_{i}"
-            if isinstance(value, list):
-                placeholders = ", ".join(
-                    [f"@{param_name}_{j}" for j, _ in enumerate(value)]
-                )
-                conditions.append(f"`{col}` {op} ({placeholders})")
+        for i, (col, op, value) in enumerate(filters):
+            param_name = f"{prefix}param_{i}"
+            if isinstance(value, list) and len(value) > self.MAX_INLINE_VALUES:
+                # Bind long lists as a single array parameter instead of one per value
+                conditions[i] = f"`{col}` {op} UNNEST(@{param_name})"
+                params[param_name] = value
+            elif isinstance(value, list):
+                placeholders = [None] * len(value)
                 for j, v in enumerate(value):
+                    placeholders[j] = f"@{param_name}_{j}"
                     params[f"{param_name}_{j}"] = v
+                conditions[i] = f"`{col}` {op} ({', '.join(placeholders)})"
             else:
-                conditions.append(f"`{col}` {op} @{param_name}")
+                conditions[i] = f"`{col}` {op} @{param_name}"
                 params[param_name] = value
         return " AND ".join(conditions), params
 
-    def _check_illegal_filters(self, col, op, value):
+    def _check_illegal_filters(self, filters: list) -> list[tuple]:
         """
-        Helper to check for illegal characters in filters.
+        Helper to check all filters for illegal operators and characters in a single pass.
+
+        Returns:
+        - list[tuple]: The filters as `(column, OPERATOR, value)`, with the operator upper-cased.
         """
-        op = op.upper()
-        if op not in self.ALLOWED_OPERATIONS:
-            raise ValueError(f"Filter operator not allowed: {op}")
-        if "`" in col:
-            raise ValueError("Column or value contains illegal character: `")
-        if "--" in col:
-            raise ValueError("Column or value contains illegal character: --")
-        if isinstance(value, str) and "--" in value:
-            raise ValueError("Column or value contains illegal character: --")
-        if isinstance(value, str) and "`" in value:
-            raise ValueError("Column or value contains illegal character: `")
+        output = [None] * len(filters)
+        for i, filter in enumerate(filters):
+            col, op, value = self._filter_to_tuple(filter)
+            op = op.upper()
+            if op not in self.ALLOWED_OPERATIONS:
+                raise ValueError(f"Filter operator not allowed: {op}")
+            if "`" in col or (isinstance(value, str) and "`" in value):
+                raise ValueError("Column or value contains illegal character: `")
+            if "--" in col or (isinstance(value, str) and "--" in value):
+                raise ValueError("Column or value contains illegal character: --")
+            output[i] = (col, op, value)
+        return output
 
 
 class BigQuery:
@@ -124,6 +474,23 @@ class BigQuery:
     Class for operating Google BigQuery.
     """
 
+    # Resolved bigquery.Table objects keyed by table_id, as (fetched_at, table)
+    _table_cache: dict = {}
+    _table_cache_ttl = 60
+    # Row message classes for the Storage Write API, keyed by the table schema
+    _row_message_cache: dict = {}
+    # Lists of at least this many rows are inserted with the Storage Write API
+    _storage_write_min_rows = 500
+    # Lists of more than this many rows are serialized with orjson for streaming inserts
+    _orjson_min_rows = 100
+    # Inferred BigQuery schemas of lists of dicts, keyed by the fingerprint of the rows.
+    # The least recently used schema is dropped once there are more than the maximum
+    _schema_cache: collections.OrderedDict = collections.OrderedDict()
+    _schema_cache_size = 128
+    # Pages are chained by page tokens and must be fetched one after another,
+    # so listing requests ask for large pages to keep the number of round trips low
+    _list_page_size = 1000
+
     def __init__(self, table=None, dataset=None, project=None, location=None):
         """
         Initializes the BigQuery client.
@@ -147,26 +514,9 @@ class BigQuery:
         - `BigQuery("dataset.table").delete()` -> Deletes the specified table.
         - `BigQuery("dataset").delete()` -> Deletes the specified dataset.
         """
-        self.table = table
-        self.dataset = dataset
+        self.project, self.dataset, self.table = _parse_fqn(table, dataset, project)
+        self.project = self.project or get_default_arg("project")
         self.location = location or get_default_arg("location")
-        self.project = project or get_default_arg("project")
-        if not project:
-            try:
-                # E.g. BigQuery(table="project.dataset.table")
-                self.project, self.dataset, self.table = table.split(".")
-            except (ValueError, AttributeError):
-                pass
-        try:
-            # E.g. BigQuery(table="dataset.table", project="project")
-            self.dataset, self.table = self.table.split(".")
-        except (ValueError, AttributeError):
-            pass
-        if self.table and "." in self.table:
-            raise ValueError("Table name cannot contain '.'")
-        if self.dataset and "." in self.dataset and not project:
-            # E.g. BigQuery(dataset="project.dataset")
-            self.project, self.dataset = self.dataset.split(".", 1)
 
         # table_id is the full table ID, e.g. "project.dataset.table"
         self.table_id = None
@@ -185,7 +535,7 @@ class BigQuery:
         self.bigquery = ModuleHandler("google.cloud").please_import(
             "bigquery", who_is_calling="BigQuery"
         )
-        self.client = ClientHandler(self.bigquery.Client).get(
+        self.client = ClientHandler(_create_bigquery_client).get(
             project=self.project, location=self.location
         )
         self.exceptions = ModuleHandler("google.api_core.exceptions").please_import(
@@ -195,7 +545,17 @@ class BigQuery:
     def __repr__(self):
         return f"BigQuery({self.table_id})"
 
-    def query(self, sql, job_config=None, schema=None, to_dataframe=False, params=None):
+    def query(
+        self,
+        sql,
+        job_config=None,
+        schema=None,
+        to_dataframe=False,
+        params=None,
+        priority="INTERACTIVE",
+        to_arrow=False,
+        use_query_cache=True,
+    ):
         """
         Executes a query against BigQuery.
 
@@ -204,33 +564,91 @@ class BigQuery:
         - job_config (bigquery.QueryJobConfig): Optional configuration for the query job.
         - to_dataframe (bool): If True, returns the results as a pandas DataFrame.
         - params (dict): Optional parameters to pass to the query.
+        - priority (str): The query priority, "INTERACTIVE" or "BATCH". Batch queries avoid competing
+                          for interactive slots and are better suited for bulk ETL jobs. Default is "INTERACTIVE".
+        - to_arrow (bool): If True, returns the results as a pyarrow Table. Takes precedence over `to_dataframe`.
+        - use_query_cache (bool): Whether to serve the results from BigQuery's result cache when the same query
+                                  text was run recently. Ignored if `job_config` already sets it. Default is True.
 
         Returns:
-        - Query results as a pandas DataFrame or BigQuery job object.
+        - Query results as a pandas DataFrame, pyarrow Table or list of rows.
         """
-        if params:
-            job_config = self._parse_query_params(params, job_config=job_config)
-        output = self.client.query(sql, job_config=job_config)
-        if to_dataframe:
+        job_config = self._prepare_job_config(
+            job_config,
+            params=params,
+            priority=priority,
+            use_query_cache=use_query_cache,
+        )
+        # query_and_wait returns the rows directly, skipping the extra QueryJob.result() call
+        output = self.client.query_and_wait(sql, job_config=job_config)
+        if to_arrow:
+            try_import("pyarrow", "BigQuery.query.to_arrow")
+
+            output = output.to_arrow(bqstorage_client=self._get_bqstorage_client())
+        elif to_dataframe:
             try_import("pandas", "BigQuery.query.to_dataframe")
 
-            output = output.to_dataframe().convert_dtypes()
+            output = output.to_dataframe(
+                bqstorage_client=self._get_bqstorage_client()
+            ).convert_dtypes()
             if schema and is_dataframe(output):
                 pd_schema = Schema(schema).pandas()
                 output = output.astype(pd_schema)
         else:
-            output = output.result()
             try:
                 output = list(output)
             except Exception as e:
-                log(f"BigQuery - Error converting query results to list: {e}")
-        sql_print = sql
-        if params:
-            for key, value in params.items():
-                sql_print = sql_print.replace(f"@{key}", str(value))
-        log(f"BigQuery - Query executed: \n{sql_print}")
+                log("BigQuery - Error converting query results to list: %s", e)
+        log("BigQuery - Query executed: \n%s", _QueryForLog(sql, params))
         return output
 
+    def _prepare_job_config(
+        self, job_config=None, params=None, priority="INTERACTIVE", use_query_cache=True
+    ):
+        """
+        Helper to build the QueryJobConfig for a query without modifying the caller's config.
+
+        Args:
+        - job_config (bigquery.QueryJobConfig): Optional base configuration for the query job.
+        - params (dict): Optional parameters to pass to the query.
+        - priority (str): The query priority, "INTERACTIVE" or "BATCH".
+        - use_query_cache (bool): Whether to use the query cache, unless `job_config` already sets it.
+
+        Returns:
+        - bigquery.QueryJobConfig: The job config to run the query with.
+        """
+        if job_config is None:
+            job_config = self.bigquery.QueryJobConfig()
+        else:
+            # Work on a copy so parameters and priority don't leak into the caller's config
+            job_config = copy.deepcopy(job_config)
+        if job_config.use_query_cache is None:
+            job_config.use_query_cache = use_query_cache
+        if job_config.use_legacy_sql is None:
+            job_config.use_legacy_sql = False
+        if params:
+            job_config = self._parse_query_params(params, job_config=job_config)
+        if priority.upper() == "BATCH":
+            job_config.priority = self.bigquery.QueryPriority.BATCH
+        return job_config
+
+    def _get_bqstorage_client(self):
+        """
+        Get a BigQuery Storage Read API client sharing the credentials of the BigQuery client.
+        Results are then downloaded as Arrow streams over gRPC rather than paged JSON over REST.
+
+        Returns:
+        - bigquery_storage.BigQueryReadClient: The client, or None if google-cloud-bigquery-storage is not installed.
+        """
+        bigquery_storage = try_import(
+            "google.cloud.bigquery_storage", "BigQuery.query", errors="ignore"
+        )
+        if bigquery_storage is None:
+            return None
+        return ClientHandler(bigquery_storage.BigQueryReadClient).get(
+            credentials=self.client._credentials
+        )
+
     def read_table(
         self,
         job_config=None,
@@ -239,6 +657,8 @@ class BigQuery:
         filters=None,
         schema=None,
         limit=None,
+        priority="INTERACTIVE",
+        to_arrow=False,
     ):
         """
         Reads entire table from BigQuery.
@@ -250,25 +670,101 @@ class BigQuery:
         - filters (list): Filters to apply.
         - schema (list): Schema to apply.
         - limit (int): Limit the number of rows to return.
+        - priority (str): The query priority, "INTERACTIVE" or "BATCH".
+        - to_arrow (bool): If True, returns the results as a pyarrow Table.
 
         Returns:
-        - Query results as a pandas DataFrame or BigQuery job object.
-        """
-        sql, params = (
-            SQLBuilder(self.table_id)
-            .select(columns)
-            .where(filters)
-            .limit(limit)
-            .build()
-        )
+        - Query results as a pandas DataFrame, pyarrow Table or list of rows.
+        """
+        if (to_dataframe or to_arrow) and columns and filters and not limit:
+            if job_config is None:
+                output = self._read_rows_direct(columns, filters, to_arrow=to_arrow)
+                if output is not None:
+                    if schema and is_dataframe(output):
+                        output = output.astype(Schema(schema).pandas())
+                    return output
+        sql, params = SQLBuilder.build_cached(self.table_id, columns, filters, limit)
         return self.query(
             sql=sql,
             job_config=job_config,
             to_dataframe=to_dataframe,
             schema=schema,
             params=params,
+            priority=priority,
+            to_arrow=to_arrow,
         )
 
+    def _read_rows_direct(self, columns, filters, to_arrow=False):
+        """
+        Read rows with the Storage Read API, without running a query job. Only used when every filter is
+        an `=` or `IN` on the table's partitioning or clustering columns, so the read is pruned as well as
+        a query would be.
+
+        Args:
+        - columns (list): Columns to select.
+        - filters (list): Filters to apply.
+        - to_arrow (bool): If True, returns a pyarrow Table instead of a pandas DataFrame.
+
+        Returns:
+        - pandas.DataFrame | pyarrow.Table: The rows, or None if the read has to go through a query.
+        """
+        bigquery_storage = try_import(
+            "google.cloud.bigquery_storage", "BigQuery.read", errors="ignore"
+        )
+        if bigquery_storage is None:
+            return None
+        filters = SQLBuilder(self.table_id)._check_illegal_filters(filters)
+        if any(op not in ("=", "IN") for _, op, _ in filters):
+            return None
+
+        table = self._get_cached_table()
+        layout_cols = set(table.clustering_fields or [])
+        if table.time_partitioning and table.time_partitioning.field:
+            layout_cols.add(table.time_partitioning.field)
+        if any(col not in layout_cols for col, _, _ in filters):
+            return None
+
+        conditions = [None] * len(filters)
+        for i, (col, op, value) in enumerate(filters):
+            values = value if isinstance(value, list) else [value]
+            literals = [_restriction_literal(v) for v in values]
+            if not literals or None in literals:
+                return None
+            if op == "IN" or isinstance(value, list):
+                conditions[i] = f"`{col}` IN ({', '.join(literals)})"
+            else:
+                conditions[i] = f"`{col}` = {literals[0]}"
+
+        if isinstance(columns, str):
+            columns = [columns]
+        types = bigquery_storage.types
+        table_path = f"projects/{table.project}/datasets/{table.dataset_id}"
+        read_session = types.ReadSession(
+            table=f"{table_path}/tables/{table.table_id}",
+            data_format=types.DataFormat.ARROW,
+            read_options=types.ReadSession.TableReadOptions(
+                selected_fields=list(columns),
+                row_restriction=" AND ".join(conditions),
+            ),
+        )
+        client = self._get_bqstorage_client()
+        try:
+            read_session = client.create_read_session(
+                parent=f"projects/{self.project}",
+                read_session=read_session,
+                max_stream_count=1,
+            )
+        except self.exceptions.GoogleAPICallError:
+            return None
+        if not read_session.streams:
+            # No matching rows: let the query build the empty result with the right columns
+            return None
+        reader = client.read_rows(read_session.streams[0].name)
+        log("BigQuery - Rows read directly from: %s", self.table_id)
+        if to_arrow:
+            return reader.to_arrow(read_session)
+        return reader.to_dataframe(read_session).convert_dtypes()
+
     def read(
         self,
         filepath=None,
@@ -278,6 +774,8 @@ class BigQuery:
         filters=None,
         schema=None,
         limit=None,
+        priority="INTERACTIVE",
+        to_arrow=False,
     ):
         """
         Reads entire table from BigQuery.
@@ -292,9 +790,11 @@ class BigQuery:
         - filters (list): Filters to apply.
         - schema (list): Schema to apply.
         - limit (int): Limit the number of rows to return.
+        - priority (str): The query priority, "INTERACTIVE" or "BATCH".
+        - to_arrow (bool): If True, returns the results as a pyarrow Table.
 
         Returns:
-        - Query results as a pandas DataFrame or BigQuery job object.
+        - Query results as a pandas DataFrame, pyarrow Table or list of rows.
         """
         if filepath is not None and isinstance(filepath, str):
             random_dataset = f"temp_dataset_{os.urandom(8).hex()}"
@@ -308,6 +808,8 @@ class BigQuery:
                 filters=filters,
                 schema=schema,
                 limit=limit,
+                priority=priority,
+                to_arrow=to_arrow,
             )
             BigQuery(dataset=random_dataset).delete()
             return output
@@ -319,8 +821,113 @@ class BigQuery:
                 filters=filters,
                 schema=schema,
                 limit=limit,
+                priority=priority,
+                to_arrow=to_arrow,
             )
 
+    def read_to_parquet(
+        self,
+        path,
+        columns=None,
+        filters=None,
+        limit=None,
+        job_config=None,
+        priority="INTERACTIVE",
+        row_group_size=100_000,
+        compression="zstd",
+    ):
+        """
+        Reads the table and streams the result into a Parquet file, one Arrow record batch at a time.
+        Unlike `read(to_dataframe=True)`, the full result is never held in memory.
+
+        Args:
+        - path (str): The Parquet file to write, either local or e.g. "gs://bucket/file.parquet".
+        - columns (list): Columns to select.
+        - filters (list): Filters to apply.
+        - limit (int): Limit the number of rows to return.
+        - job_config (bigquery.QueryJobConfig): Optional configuration for the query job.
+        - priority (str): The query priority, "INTERACTIVE" or "BATCH".
+        - row_group_size (int): Maximum number of rows per Parquet row group.
+        - compression (str): The Parquet compression codec.
+
+        Returns:
+        - int: The number of rows written.
+        """
+        pq = ModuleHandler("pyarrow.parquet").please_import(who_is_calling="BigQuery")
+        sql, params = SQLBuilder.build_cached(self.table_id, columns, filters, limit)
+        job_config = self._prepare_job_config(
+            job_config, params=params, priority=priority
+        )
+        rows = self.client.query_and_wait(sql, job_config=job_config)
+        batches = rows.to_arrow_iterable(bqstorage_client=self._get_bqstorage_client())
+
+        n_rows = 0
+        writer = None
+        try:
+            for batch in batches:
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        path, batch.schema, compression=compression
+                    )
+                writer.write_batch(batch, row_group_size=row_group_size)
+                n_rows += batch.num_rows
+            if writer is None:
+                # Empty result: still write a file with the right schema
+                empty_table = _bq_to_arrow_schema(rows.schema).empty_table()
+                pq.write_table(empty_table, path, compression=compression)
+        finally:
+            if writer is not None:
+                writer.close()
+        log("BigQuery - %s rows written from %s to %s", n_rows, self.table_id, path)
+        return n_rows
+
+    def read_many(
+        self,
+        filters_list,
+        columns=None,
+        schema=None,
+        job_config=None,
+        priority="INTERACTIVE",
+    ):
+        """
+        Reads several filtered subsets of the table in a single query job.
+        The filter sets are combined with UNION ALL, so N reads cost one job instead of N.
+
+        Args:
+        - filters_list (list[list[tuple]]): The filter sets to read, one per output DataFrame.
+        - columns (list): Columns to select.
+        - schema (list): Schema to apply.
+        - job_config (bigquery.QueryJobConfig): Optional configuration for the query job.
+        - priority (str): The query priority, "INTERACTIVE" or "BATCH".
+
+        Returns:
+        - list[pandas.DataFrame]: One DataFrame per filter set, in the same order as `filters_list`.
+
+        Examples:
+        - `BigQuery("dataset.table").read_many([[("a", "=", 1)], [("a", "=", 2)]])`
+            -> [DataFrame of rows where a = 1, DataFrame of rows where a = 2]
+        """
+        if not filters_list:
+            return []
+        sql, params = (
+            SQLBuilder(self.table_id).union_all(filters_list, columns=columns).build()
+        )
+        output = self.query(
+            sql=sql,
+            job_config=job_config,
+            to_dataframe=True,
+            schema=schema,
+            params=params,
+            priority=priority,
+        )
+        # Split the combined result back into one DataFrame per filter set
+        batch_ids = output.pop("__batch")
+        positions = batch_ids.groupby(batch_ids).indices
+        return [
+            output.iloc[positions.get(k, [])].reset_index(drop=True)
+            for k in range(len(filters_list))
+        ]
+
     def _parse_query_params(self, params, job_config=None):
         """
         Helper to parse query parameters into bigquery.QueryJobConfig.
@@ -335,18 +942,17 @@ class BigQuery:
         if not job_config:
             job_config = self.bigquery.QueryJobConfig()
 
-        query_params = []
-
+        query_params = list(job_config.query_parameters)
         for key, value in params.items():
-            val_type = {"int": "INTEGER", "float": "FLOAT", "str": "STRING"}.get(
-                type(value).__name__, "STRING"
-            )
             if isinstance(value, list):
+                # Arrays are homogeneous, so the first element decides the type
+                val_type = _bq_param_type(value[0]) if value else "STRING"
                 bq_param = self.bigquery.ArrayQueryParameter(key, val_type, value)
             else:
+                val_type = _bq_param_type(value)
                 bq_param = self.bigquery.ScalarQueryParameter(key, val_type, value)
             query_params.append(bq_param)
-        job_config.query_parameters = job_config.query_parameters + query_params
+        job_config.query_parameters = query_params
         return job_config
 
     def insert(self, data, schema=None):
@@ -365,10 +971,11 @@ class BigQuery:
         - BigQuery("dataset.table").insert(pd.DataFrame({"a": [1], "b": ["test"]}))
         """
         if is_dataframe(data):
-            try_import("pandas_gbq", "BigQuery.insert.dataframe")
-            from pandas_gbq import to_gbq
+            pandas_gbq = ModuleHandler("pandas_gbq").please_import(
+                who_is_calling="BigQuery"
+            )
 
-            return to_gbq(
+            return pandas_gbq.to_gbq(
                 data,
                 destination_table=self.table_id,
                 if_exists="append",
@@ -379,25 +986,265 @@ class BigQuery:
             data = orient_dict(data, orientation="index")
 
         if not schema and isinstance(data, list):
-            table = self.client.get_table(self.table_id)  # Make sure the table exists
-            errors = self.client.insert_rows_json(table, data)
+            table = self._get_cached_table()  # Make sure the table exists
+            try:
+                errors = self._insert_rows(table, data)
+            except self.exceptions.NotFound:
+                # The cached table may be stale (e.g. dropped and recreated)
+                self._table_cache.pop(self.table_id, None)
+                table = self._get_cached_table()
+                errors = self._insert_rows(table, data)
         elif schema:
             table = self.bigquery.Table(self.table_id, schema=schema)
-            errors = self.client.insert_rows_json(table, data)
+            errors = self._insert_rows(table, data)
         else:
             raise ValueError(
                 "Data format not supported or schema required for new table."
             )
 
         if errors == []:
-            log(f"BigQuery - Data inserted into: {self.table}")
+            log("BigQuery - Data inserted into: %s", self.table)
             return True
         else:
             log(
-                f"BigQuery - Errors occurred while inserting data into: {self.table} -- {errors}"
+                "BigQuery - Errors occurred while inserting data into: %s -- %s",
+                self.table,
+                errors,
             )
             return False
 
+    def _insert_rows(self, table, data):
+        """
+        Insert a list of rows into a table. Large batches go through the Storage Write API,
+        everything else (or anything it cannot handle) through the streaming insert API.
+
+        Args:
+        - table (bigquery.Table): The table to insert into. Its schema must be set.
+        - data (list of dicts): The rows to insert.
+
+        Returns:
+        - list: The row errors, empty if successful.
+        """
+        if len(data) >= self._storage_write_min_rows:
+            errors = self._append_rows(table, data)
+            if errors is not None:
+                return errors
+        if len(data) > self._orjson_min_rows:
+            errors = self._insert_rows_orjson(table, data)
+            if errors is not None:
+                return errors
+        return self.client.insert_rows_json(table, data)
+
+    def _insert_rows_orjson(self, table, data):
+        """
+        Equivalent of `client.insert_rows_json`, but the request body is serialized with orjson
+        instead of the standard library json encoder.
+
+        Args:
+        - table (bigquery.Table): The table to insert into.
+        - data (list of dicts): The rows to insert.
+
+        Returns:
+        - list: The row errors, empty if successful. None if orjson is not installed, the rows contain values
+                insert_rows_json would not serialize, or the client has no session to send the request with.
+        """
+        orjson = try_import("orjson", "BigQuery.insert", errors="ignore")
+        if orjson is None:
+            return None
+        # The client only sends bodies it serializes itself, so the request goes out
+        # over its authorized session. Fall back to insert_rows_json without one
+        http = getattr(self.client, "_http", None)
+        connection = getattr(self.client, "_connection", None)
+        build_api_url = getattr(connection, "build_api_url", None)
+        if not callable(getattr(http, "post", None)) or not callable(build_api_url):
+            return None
+        # Every row gets an insert ID, so the request can always be retried
+        rows = [{"json": row, "insertId": str(uuid.uuid4())} for row in data]
+        try:
+            # Reject the values json.dumps rejects in insert_rows_json (datetimes,
+            # dataclasses, numpy arrays and integers), so that they fail there instead
+            # and the batch size does not change which rows can be inserted
+            option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            body = orjson.dumps({"rows": rows}, option=option)
+        except TypeError:
+            return None
+        url = build_api_url(path=f"{table.path}/insertAll")
+
+        def send():
+            response = http.post(
+                url, data=body, headers={"Content-Type": "application/json"}
+            )
+            if not 200 <= response.status_code < 300:
+                raise self.exceptions.from_http_response(response)
+            return response.json()
+
+        response = self.bigquery.DEFAULT_RETRY(send)()
+        return [
+            {"index": int(error["index"]), "errors": error["errors"]}
+            for error in response.get("insertErrors", ())
+        ]
+
+    def _append_rows(self, table, data):
+        """
+        Insert rows with the Storage Write API, appending protobuf-encoded rows to the
+        table's default stream in a single request, so either all rows are written or none.
+
+        Args:
+        - table (bigquery.Table): The table to insert into. Its schema must be set.
+        - data (list of dicts): The rows to insert.
+
+        Returns:
+        - list: The row errors, empty if successful. None if the rows could not be written this way,
+                e.g. google-cloud-bigquery-storage is not installed, the schema has nested fields
+                or the rows do not fit in a single request.
+        """
+        bigquery_storage = try_import(
+            "google.cloud.bigquery_storage_v1", "BigQuery.insert", errors="ignore"
+        )
+        if bigquery_storage is None:
+            return None
+        row_message = self._get_row_message(table.schema)
+        if row_message is None:
+            return None
+        row_class, row_descriptor, string_fields = row_message
+        try:
+            rows = [
+                row_class(
+                    **{
+                        k: _storage_write_value(v, k in string_fields)
+                        for k, v in row.items()
+                        if v is not None
+                    }
+                ).SerializeToString()
+                for row in data
+            ]
+        except (ValueError, TypeError):
+            # Let the streaming insert API report (or reject) the offending rows
+            return None
+
+        # Only a single AppendRows request is all-or-nothing. Every request to the
+        # default stream is committed as soon as it is accepted, so payloads which
+        # would need several requests go through the streaming insert API instead
+        if sum(map(len, rows)) > 9_000_000:
+            return None
+
+        types = bigquery_storage.types
+        write_client = ClientHandler(bigquery_storage.BigQueryWriteClient).get(
+            credentials=self.client._credentials
+        )
+        table_path = write_client.table_path(
+            table.project, table.dataset_id, table.table_id
+        )
+        template = types.AppendRowsRequest(
+            write_stream=f"{table_path}/streams/_default",
+            proto_rows=types.AppendRowsRequest.ProtoData(
+                writer_schema=types.ProtoSchema(proto_descriptor=row_descriptor)
+            ),
+        )
+        request = types.AppendRowsRequest(
+            proto_rows=types.AppendRowsRequest.ProtoData(
+                rows=types.ProtoRows(serialized_rows=rows)
+            )
+        )
+
+        stream = bigquery_storage.writer.AppendRowsStream(write_client, template)
+        try:
+            stream.send(request).result()
+        except self.exceptions.MethodNotImplemented:
+            return None
+        except self.exceptions.GoogleAPICallError as e:
+            # Rejected rows fail the whole request, with the offending rows attached
+            row_errors = getattr(getattr(e, "response", None), "row_errors", None)
+            if not row_errors:
+                return None
+            return [{"index": err.index, "errors": err.message} for err in row_errors]
+        finally:
+            stream.close()
+        return []
+
+    def _get_row_message(self, schema):
+        """
+        Compile a protobuf message class matching a flat BigQuery schema, for use with the Storage Write API.
+        The result is cached per schema, so each table schema is compiled once.
+
+        Args:
+        - schema (list of bigquery.SchemaField): The table schema.
+
+        Returns:
+        - tuple: (message class, DescriptorProto, set of fields sent as strings), or None if the schema
+                 has fields which cannot be encoded (e.g. nested, repeated, bytes or timestamps, or
+                 names which are not valid proto field names).
+        """
+        key = tuple((f.name, f.field_type, f.mode) for f in schema)
+        if key in self._row_message_cache:
+            return self._row_message_cache[key]
+
+        from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+        field_proto = descriptor_pb2.FieldDescriptorProto
+        proto_types = {
+            "STRING": field_proto.TYPE_STRING,
+            "INTEGER": field_proto.TYPE_INT64,
+            "INT64": field_proto.TYPE_INT64,
+            "FLOAT": field_proto.TYPE_DOUBLE,
+            "FLOAT64": field_proto.TYPE_DOUBLE,
+            "BOOLEAN": field_proto.TYPE_BOOL,
+            "BOOL": field_proto.TYPE_BOOL,
+        }
+        # The Storage Write API accepts these types in their canonical string form
+        string_types = {"NUMERIC", "BIGNUMERIC", "DATE", "DATETIME", "TIME"}
+
+        file_proto = descriptor_pb2.FileDescriptorProto(
+            name="gcp_pal_row.proto", package="gcp_pal", syntax="proto2"
+        )
+        row_descriptor = file_proto.message_type.add(name="Row")
+        string_fields = set()
+        output = None
+        for i, field in enumerate(schema, start=1):
+            field_type = field.field_type.upper()
+            if field.mode == "REPEATED":
+                break
+            if field_type in string_types:
+                string_fields.add(field.name)
+                proto_type = field_proto.TYPE_STRING
+            elif field_type in proto_types:
+                proto_type = proto_types[field_type]
+            else:
+                break
+            row_descriptor.field.add(
+                name=field.name,
+                number=i,
+                type=proto_type,
+                label=field_proto.LABEL_OPTIONAL,
+            )
+        else:
+            try:
+                pool = descriptor_pool.DescriptorPool()
+                pool.Add(file_proto)
+                row_class = message_factory.GetMessageClass(
+                    pool.FindMessageTypeByName("gcp_pal.Row")
+                )
+                output = (row_class, row_descriptor, string_fields)
+            except (TypeError, ValueError):
+                # Column names which are not valid proto field names, e.g. "my-col"
+                output = None
+        self._row_message_cache[key] = output
+        return output
+
+    def _get_cached_table(self):
+        """
+        Get the bigquery.Table object, reusing a recently fetched one if available.
+
+        Returns:
+        - The bigquery.Table object.
+        """
+        cached = self._table_cache.get(self.table_id)
+        if cached and time.monotonic() - cached[0] < self._table_cache_ttl:
+            return cached[1]
+        table = self.client.get_table(self.table_id)
+        self._table_cache[self.table_id] = (time.monotonic(), table)
+        return table
+
     def write(self, data, schema=None):
         """
         Writes data to a BigQuery table. If the table does not exist, it will be created. If the table exists, the data will be appended.
@@ -411,22 +1258,56 @@ class BigQuery:
         """
         if is_dataframe(data):
             self._create_table(data, schema=schema, exists_ok=True, if_exists="append")
-            log(f"BigQuery - DataFrame written to {self.table}, schema: {schema}")
+            log("BigQuery - DataFrame written to %s, schema: %s", self.table, schema)
             return True
 
         if isinstance(data, dict):
             data = [data]
 
         if not schema:
-            schema = Schema(data, is_data=True).bigquery()
+            schema = self._infer_schema(data)
 
         try:
             success = self.insert(data, schema=schema)
         except self.exceptions.NotFound:
             success = self.create_table(data, schema=schema, exists_ok=True)
-        log(f"BigQuery - Data written to {self.table}, schema: {schema}")
+        log("BigQuery - Data written to %s, schema: %s", self.table, schema)
         return success
 
+    def _infer_schema(self, data):
+        """
+        Infer the BigQuery schema of a list of dicts, reusing the schema inferred for earlier data
+        of the same shape. The shape is fingerprinted from the column names and value types of
+        every row, so it determines the inferred schema. Rows with nested values or differing
+        shapes are always inferred in full.
+
+        Args:
+        - data (list of dicts): The data to infer the schema from.
+
+        Returns:
+        - list of bigquery.SchemaField: The inferred schema.
+        """
+        fingerprint = None
+        if data and isinstance(data[0], dict):
+            fingerprint = tuple((k, type(v)) for k, v in data[0].items())
+        if fingerprint is None or any(t in (dict, list) for _, t in fingerprint):
+            return Schema(data, is_data=True).bigquery()
+        for row in itertools.islice(data, 1, None):
+            if (
+                not isinstance(row, dict)
+                or tuple((k, type(v)) for k, v in row.items()) != fingerprint
+            ):
+                return Schema(data, is_data=True).bigquery()
+        cache = self._schema_cache
+        try:
+            schema = cache[fingerprint]
+            cache.move_to_end(fingerprint)
+        except KeyError:
+            schema = cache[fingerprint] = Schema(data, is_data=True).bigquery()
+            while len(cache) > self._schema_cache_size:
+                cache.popitem(last=False)
+        return schema
+
     def _create_table(
         self,
         data=None,
@@ -437,6 +1318,7 @@ class BigQuery:
         range_partition_col=None,
         cluster_cols=None,
         labels=None,
+        infer_partitioning=False,
     ):
         """
         Routine for creating a new BigQuery table.
@@ -450,6 +1332,9 @@ class BigQuery:
         - range_partition_col (str): The column to partition the table by. This is used for range-based partitioning.
         - cluster_cols (list): The columns to cluster the table by.
         - labels (dict): Labels to apply to the table.
+        - infer_partitioning (bool): If True, partition the table by its first DATE/DATETIME/TIMESTAMP column
+                                     and cluster it by up to 4 leading STRING/INTEGER columns, unless
+                                     `time_partition_col`/`range_partition_col`/`cluster_cols` are given.
 
         Returns:
         - True if successful.
@@ -462,17 +1347,40 @@ class BigQuery:
             schema = dict_to_bigquery_fields(schema)
 
         if is_dataframe(data):
-            try_import("pandas_gbq", "BigQuery.create_table.dataframe")
-            from pandas_gbq import to_gbq
+            pandas_gbq = ModuleHandler("pandas_gbq").please_import(
+                who_is_calling="BigQuery"
+            )
 
             if if_exists is None:
                 if_exists = "replace" if exists_ok else "fail"
-            return to_gbq(
+            layout = time_partition_col or range_partition_col or cluster_cols
+            if (layout or infer_partitioning) and (
+                if_exists != "append" or not self.exists()
+            ):
+                # to_gbq cannot partition or cluster, so create the table first and append to it
+                if if_exists == "replace":
+                    self.client.delete_table(self.table_id, not_found_ok=True)
+                self._create_table(
+                    schema=schema or Schema(data, is_data=True).bigquery(),
+                    exists_ok=False,
+                    time_partition_col=time_partition_col,
+                    range_partition_col=range_partition_col,
+                    cluster_cols=cluster_cols,
+                    labels=labels,
+                    infer_partitioning=infer_partitioning,
+                )
+                if_exists = "append"
+            return pandas_gbq.to_gbq(
                 data,
                 destination_table=self.table_id,
                 if_exists=if_exists,
                 location=self.location,
             )
+        if infer_partitioning and schema:
+            inferred_time_col, inferred_cluster_cols = _infer_partitioning(schema)
+            if not range_partition_col:
+                time_partition_col = time_partition_col or inferred_time_col
+            cluster_cols = cluster_cols or inferred_cluster_cols
         table = self.bigquery.Table(self.table_id, schema=schema)
         if time_partition_col:
             table.time_partitioning = self.bigquery.TimePartitioning(
@@ -488,18 +1396,31 @@ class BigQuery:
             table.labels = labels
 
         table = self.client.create_table(table, exists_ok=exists_ok)
-        log(f"BigQuery - Table created: {self.table_id}")
+        log("BigQuery - Table created: %s", self.table_id)
 
         if data is not None:
             self.insert(data, schema=schema)
         return True
 
-    def create_table(self, data=None, schema=None, exists_ok=True):
+    def create_table(
+        self,
+        data=None,
+        schema=None,
+        exists_ok=True,
+        time_partition_col=None,
+        cluster_cols=None,
+        infer_partitioning=False,
+    ):
         """
         Creates a new BigQuery table.
 
         Args:
         - schema (list of bigquery.SchemaField or dict): The schema definition for the new table.
+        - time_partition_col (str): The DATE/DATETIME/TIMESTAMP column to partition the table by.
+        - cluster_cols (list): The columns to cluster the table by (up to 4).
+        - infer_partitioning (bool): If True, pick the partitioning and clustering columns from the schema
+                                     when they are not given. Filters on these columns then scan only
+                                     the matching partitions and blocks.
 
         Returns:
         - The created bigquery.Table object.
@@ -509,12 +1430,20 @@ class BigQuery:
         - or schema = {"name": "STRING", "age": "INTEGER"}
         - BigQuery().create_table("new_dataset.new_table", schema)
         """
+        kwargs = dict(
+            data=data,
+            schema=schema,
+            exists_ok=exists_ok,
+            time_partition_col=time_partition_col,
+            cluster_cols=cluster_cols,
+            infer_partitioning=infer_partitioning,
+        )
         try:
-            return self._create_table(data=data, schema=schema, exists_ok=exists_ok)
+            return self._create_table(**kwargs)
         except self.exceptions.NotFound:
             # Dataset does not exist, so create it and try again
             self.create_dataset(exists_ok=exists_ok)
-            return self._create_table(data=data, schema=schema, exists_ok=exists_ok)
+            return self._create_table(**kwargs)
         return False
 
     def _create_external_table(
@@ -560,7 +1489,7 @@ class BigQuery:
             # Dataset does not exist, so create it and try again
             self.create_dataset()
             self.client.create_table(table)
-        log(f"BigQuery - External table created: {self.table_id}")
+        log("BigQuery - External table created: %s", self.table_id)
         return True
 
     def create_external_table(self, uri, schema=None, exists_ok=True):
@@ -633,7 +1562,7 @@ class BigQuery:
         """
         dataset = self.bigquery.Dataset(self.dataset_id)
         dataset = self.client.create_dataset(dataset, exists_ok=exists_ok)
-        log(f"BigQuery - Dataset created: {self.dataset_id}")
+        log("BigQuery - Dataset created: %s", self.dataset_id)
         return True
 
     def create(self, data=None, schema=None, exists_ok=True, infer_schema=False):
@@ -673,14 +1602,15 @@ class BigQuery:
         Returns:
         - True if successful.
         """
+        self._table_cache.pop(self.table_id, None)
         try:
             self.client.delete_table(self.table_id)
         except Exception as e:
-            log(f"BigQuery - Error deleting table: {e}")
+            log("BigQuery - Error deleting table: %s", e)
             if errors == "raise":
                 raise e
             return False
-        log(f"BigQuery - Table deleted: BigQuery/{self.table_id}")
+        log("BigQuery - Table deleted: BigQuery/%s", self.table_id)
         return True
 
     def delete_dataset(self, errors="raise"):
@@ -691,14 +1621,18 @@ class BigQuery:
         - True if successful.
         """
         dataset_id = f"{self.project}.{self.dataset}"
+        # The dataset's tables are deleted with it
+        prefix = f"{dataset_id}."
+        for table_id in [k for k in self._table_cache if k.startswith(prefix)]:
+            self._table_cache.pop(table_id, None)
         try:
             self.client.delete_dataset(dataset_id, delete_contents=True)
         except Exception as e:
-            log(f"BigQuery - Error deleting dataset: {e}")
+            log("BigQuery - Error deleting dataset: %s", e)
             if errors == "raise":
                 raise e
             return False
-        log(f"BigQuery - Dataset deleted: BigQuery/{dataset_id}")
+        log("BigQuery - Dataset deleted: BigQuery/%s", dataset_id)
         return True
 
     def delete(self, errors="ignore"):
@@ -723,7 +1657,7 @@ class BigQuery:
         Returns:
         - List of dataset IDs.
         """
-        datasets = list(self.client.list_datasets())
+        datasets = self.client.list_datasets(page_size=self._list_page_size)
         dataset_ids = [dataset.dataset_id for dataset in datasets]
         log("BigQuery - datasets listed.")
         return dataset_ids
@@ -739,9 +1673,9 @@ class BigQuery:
         - List of table IDs within the specified dataset.
         """
         dataset = dataset or self.dataset
-        tables = list(self.client.list_tables(dataset))
+        tables = self.client.list_tables(dataset, page_size=self._list_page_size)
         table_ids = [table.table_id for table in tables]
-        log(f"BigQuery - Tables listed for dataset: {dataset}")
+        log("BigQuery - Tables listed for dataset: %s", dataset)
         return table_ids
 
     def ls(self, dataset=None):
@@ -789,7 +1723,7 @@ class BigQuery:
         - True if successful.
         """
         success = self.client.create_snapshot(snapshot_name, self.table_id)
-        log(f"BigQuery - Snapshot created: {snapshot_name}")
+        log("BigQuery - Snapshot created: %s", snapshot_name)
         return success
 
     def get_table(self):
@@ -852,6 +1786,7 @@ class BigQuery:
             schema = dict_to_bigquery_fields(schema)
         table = self.get_table()
         table.schema = schema
+        self._table_cache.pop(self.table_id, None)
         return self.client.update_table(table, ["schema"])
 
 
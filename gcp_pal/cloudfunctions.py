@@ -1,9 +1,12 @@
 import os
 import json
+import time
 
 from gcp_pal.utils import (
     log,
     get_all_kwargs,
+    prefetch_pages,
+    await_operation,
     ClientHandler,
     ModuleHandler,
     get_default_arg,
@@ -12,6 +15,15 @@ from gcp_pal.utils import (
 
 class CloudFunctions:
 
+    # Recently fetched functions keyed by function ID, as (fetched_at, function)
+    _get_cache: dict = {}
+    _get_cache_ttl = 5.0
+    # Function URIs keyed by function ID. A function keeps its URI across redeployments.
+    _uri_cache: dict = {}
+    # Request protos keyed by (request type, field values). Building a proto resolves
+    # every field through its descriptor, so fixed requests are built once and reused.
+    _request_cache: dict = {}
+
     def __init__(self, name=None, project=None, location=None, service_account=None):
         if isinstance(name, str) and name.startswith("projects/"):
             name = name.split("/")[-1]
@@ -35,6 +47,44 @@ class CloudFunctions:
     def __repr__(self):
         return f"CloudFunctions({self.name})"
 
+    def _request(self, request_type, **fields):
+        """
+        Returns a request proto of the given type, reusing a previously built one if the
+        fields are the same. Only for requests which the client doesn't modify.
+
+        Args:
+        - request_type (str): The name of the request type, e.g. "GetFunctionRequest".
+        - fields (dict): The fields of the request.
+
+        Returns:
+        - (proto.Message) The request.
+        """
+        key = (request_type, *sorted(fields.items()))
+        request = self._request_cache.get(key)
+        if request is None:
+            request = getattr(self.functions, request_type)(**fields)
+            self._request_cache[key] = request
+        return request
+
+    def iter_functions(self, active_only=False, full_id=False):
+        """
+        Iterate over the cloud functions in the project, fetching the next page while the current one is consumed.
+
+        Args:
+        - active_only (bool): Whether to only list active cloud functions.
+        - full_id (bool): Whether to return the full resource names.
+
+        Returns:
+        - (generator) The cloud function names.
+        """
+        request = self._request("ListFunctionsRequest", parent=self.parent)
+        pager = self.client.list_functions(request)
+        for page in prefetch_pages(pager.pages):
+            for function in page.functions:
+                if active_only and function.state.name != "ACTIVE":
+                    continue
+                yield function.name if full_id else function.name.split("/")[-1]
+
     def ls(self, active_only=False, full_id=False):
         """
         Lists all cloud functions in the project.
@@ -45,23 +95,16 @@ class CloudFunctions:
         Returns:
         - (list) List of cloud functions.
         """
-        parent = f"projects/{self.project}/locations/{self.location}"
-        request = self.functions.ListFunctionsRequest(parent=parent)
-        page_result = self.client.list_functions(request)
-        if active_only:
-            output = [f.name for f in page_result if f.status.name == "ACTIVE"]
-        else:
-            output = [f.name for f in page_result]
-        if not full_id:
-            output = [f.split("/")[-1] for f in output]
-        return output
+        return list(self.iter_functions(active_only=active_only, full_id=full_id))
 
-    def get(self, name=None):
+    def get(self, name=None, force_refresh=False):
         """
-        Gets a cloud function.
+        Gets a cloud function. Results are reused for a few seconds, so that repeated
+        `exists`/`get` calls during a deployment don't each cost a round trip.
 
         Args:
         - name (str): The name of the cloud function.
+        - force_refresh (bool): If True, always fetch the cloud function from the API.
 
         Returns:
         - (dict) The cloud function.
@@ -70,18 +113,38 @@ class CloudFunctions:
             function_id = f"{self.parent}/functions/{name}"
         else:
             function_id = self.function_id
-        request = self.functions.GetFunctionRequest(name=function_id)
+        cached = self._get_cache.get(function_id)
+        if (
+            cached
+            and not force_refresh
+            and time.monotonic() - cached[0] < self._get_cache_ttl
+        ):
+            return cached[1]
+        request = self._request("GetFunctionRequest", name=function_id)
         output = self.client.get_function(request)
+        self._get_cache[function_id] = (time.monotonic(), output)
         return output
 
     def uri(self):
         """
-        Returns the URI of the cloud function.
+        Returns the URI of the cloud function. The URI is remembered after the first lookup,
+        so that `call` doesn't need a `GetFunction` round trip on every invocation.
 
         Returns:
         - (str) The URI of the cloud function.
         """
-        return self.get().service_config.uri
+        uri = self._uri_cache.get(self.function_id)
+        if uri is None:
+            uri = self.get().service_config.uri
+            if uri:
+                self._uri_cache[self.function_id] = uri
+        return uri
+
+    def invalidate_uri(self):
+        """
+        Forgets the remembered URI of the cloud function, e.g. after it was redeployed elsewhere.
+        """
+        self._uri_cache.pop(self.function_id, None)
 
     def exists(self):
         """
@@ -137,6 +200,69 @@ class CloudFunctions:
                 pass
         return output
 
+    async def call_async(self, data={}, **kwargs):
+        """
+        Calls the cloud function without blocking the event loop. Awaiting many calls together
+        overlaps their round trips, e.g.:
+        `await asyncio.gather(*[CloudFunctions(name).call_async(data) for name, data in calls])`
+
+        Args:
+        - data (dict|str): The data to send to the cloud function. Defaults to {}.
+        - kwargs: Additional arguments to pass to `call`.
+
+        Returns:
+        - (dict) The response from the cloud function.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.call, data=data, **kwargs)
+
+    def call_batched(self, payloads, max_batch=32, max_workers=8, **kwargs):
+        """
+        Calls the cloud function with many payloads, sending up to `max_batch` of them
+        per request. This cuts the number of invocations (and cold starts) by up to
+        `max_batch` times, at the cost of each request taking longer.
+
+        The function must accept the envelope `{"batch": [payload, ...]}` and respond with
+        `{"batch": [result, ...]}` (or a plain list), one result per payload, in order.
+
+        Args:
+        - payloads (list): The payloads to send.
+        - max_batch (int): The maximum number of payloads per request. Defaults to 32.
+        - max_workers (int): The maximum number of requests in flight at once. Defaults to 8.
+        - kwargs: Additional arguments to pass to `call`.
+
+        Returns:
+        - (list) One result per payload, in the same order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        payloads = list(payloads)
+        batches = [
+            payloads[i : i + max_batch] for i in range(0, len(payloads), max_batch)
+        ]
+        if not batches:
+            return []
+
+        def call_one(batch):
+            output = self.call(data=json.dumps({"batch": batch}), **kwargs)
+            if isinstance(output, dict):
+                output = output.get("batch")
+            if not isinstance(output, list) or len(output) != len(batch):
+                msg = f"Cloud Function - Invalid batch response from '{self.name}'."
+                raise ValueError(msg)
+            return output
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            results = list(executor.map(call_one, batches))
+        return [result for batch_results in results for result in batch_results]
+
+    async def invoke_async(self, **kwargs):
+        """
+        Alias for call_async.
+        """
+        return await self.call_async(**kwargs)
+
     def invoke(self, **kwargs):
         """
         Alias for call.
@@ -183,6 +309,71 @@ class CloudFunctions:
         else:
             return self.deploy_from_zip(**input_kwargs)
 
+    @classmethod
+    def deploy_many(cls, specs, max_concurrency=16):
+        """
+        Deploys several cloud functions at the same time.
+
+        Args:
+        - specs (list): One dict per cloud function, holding `name` (and optionally `project`,
+          `location`) plus the arguments for `deploy`.
+        - max_concurrency (int): The maximum number of deployments in flight at once.
+
+        Returns:
+        - (dict) The result of each deployment keyed by name. Failed deployments map to
+          their exception, so that one failure doesn't abort the rest of the batch.
+
+        Examples:
+        >>> specs = [{"name": n, "path": f"src/{n}", "entry_point": "main"} for n in "ab"]
+        >>> CloudFunctions.deploy_many(specs)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def deploy_one(spec):
+            spec = dict(spec)
+            init_kwargs = {
+                k: spec.pop(k) for k in ("name", "project", "location") if k in spec
+            }
+            try:
+                return cls(**init_kwargs).deploy(**spec)
+            except Exception as e:
+                name = init_kwargs.get("name")
+                log("Cloud Function - Error deploying '%s': %s", name, e)
+                return e
+
+        specs = list(specs)
+        if not specs:
+            return {}
+        max_workers = min(max_concurrency, len(specs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(deploy_one, specs))
+        return {spec["name"]: result for spec, result in zip(specs, results)}
+
+    async def deploy_async(self, path, entry_point, **kwargs):
+        """
+        Deploys a cloud function without blocking the event loop while the deployment runs.
+        Awaiting many deployments together overlaps them on a single thread, e.g.:
+        `await asyncio.gather(*[CloudFunctions(name).deploy_async(path, "main") for ...])`
+
+        Args:
+        - path (str): The path to the source code.
+        - entry_point (str): The name of the function to execute.
+        - kwargs: Additional arguments to pass to `deploy`.
+
+        Returns:
+        - (Function) The deployed cloud function.
+        """
+        import asyncio
+
+        kwargs["wait_to_complete"] = False
+        operation = await asyncio.to_thread(self.deploy, path, entry_point, **kwargs)
+        function = await await_operation(operation)
+        self._get_cache.pop(self.function_id, None)
+        if function.service_config.uri:
+            self._uri_cache[self.function_id] = function.service_config.uri
+        log("Cloud Function - '%s': %s.", self.name, function.state.name)
+        return function
+
     def deploy_from_zip(
         self,
         path,
@@ -206,17 +397,17 @@ class CloudFunctions:
             raise FileNotFoundError(f"Local file not found: {path}")
 
         from gcp_pal import Storage, Project
-        from gcp_pal.utils import zip_directory
+        from gcp_pal.utils import zip_directory_stream
 
-        log(f"Cloud Function - Creating zip file from {path} and uploading to GCS...")
-        zip_path = zip_directory(path)
-        # Upload the zip file to GCS
+        log("Cloud Function - Creating zip file from %s and uploading to GCS...", path)
+        zip_buffer = zip_directory_stream(path)
+        # Upload the zip archive to GCS straight from memory
 
         project_num = Project(self.project).number()
         default_bucket = f"gcf-v2-sources-{project_num}-{self.location}"
         bucket_name = source_bucket or default_bucket
         upload_path = f"{bucket_name}/cloud-functions/{self.name}/{self.name}.zip"
-        Storage(upload_path).upload(zip_path)
+        Storage(upload_path).upload(contents=zip_buffer.getvalue())
         # Deploy the cloud function
         source_archive_url = Storage(upload_path).path
         return self.deploy_from_repo(
@@ -256,7 +447,7 @@ class CloudFunctions:
         - (dict) The response from the cloud function.
         """
 
-        log(f"Cloud Function - Deploying '{self.name}' from repository {path}...")
+        log("Cloud Function - Deploying '%s' from repository %s...", self.name, path)
         if path.startswith("gs://"):
             from gcp_pal import Storage
 
@@ -291,17 +482,18 @@ class CloudFunctions:
             **kwargs,
         )
         if function_exists and if_exists.lower() == "replace":
-            log(f"Cloud Function - Updating '{self.name}'...")
+            log("Cloud Function - Updating '%s'...", self.name)
             request = self.functions.UpdateFunctionRequest(
                 function=cloud_function, update_mask=None
             )
             output = self.client.update_function(request)
         else:
-            print(f"Cloud Function - Creating '{self.name}'...")
+            log("Cloud Function - Creating '%s'...", self.name)
             request = self.functions.CreateFunctionRequest(
                 function=cloud_function, parent=self.parent, function_id=self.name
             )
             output = self.client.create_function(request)
+        self._get_cache.pop(self.function_id, None)
         self._handle_deploy_response(output, wait_to_complete)
         return output
 
@@ -312,7 +504,7 @@ class CloudFunctions:
         Returns:
         - (str) The state of the cloud function.
         """
-        function = self.get()
+        function = self.get(force_refresh=True)
         return function.state.name
 
     def status(self):
@@ -332,17 +524,19 @@ class CloudFunctions:
         Returns:
         - (dict) The response from the delete request.
         """
-        request = self.functions.DeleteFunctionRequest(name=self.function_id)
+        request = self._request("DeleteFunctionRequest", name=self.function_id)
+        self._get_cache.pop(self.function_id, None)
+        self.invalidate_uri()
         try:
             output = self.client.delete_function(request)
             if wait_to_complete:
                 output = output.result(timeout=300)
-            print(f"Cloud Function - Deleted '{self.name}'.")
+            log("Cloud Function - Deleted '%s'.", self.name)
         except Exception as e:
             if errors == "raise":
                 raise e
             elif errors == "log":
-                log(f"Cloud Function - Error deleting: {e}")
+                log("Cloud Function - Error deleting: %s", e)
             output = None
         return output
 
@@ -357,17 +551,20 @@ class CloudFunctions:
         Returns:
         - (dict) The response from the deploy request.
         """
-        output = response
-        if wait_to_complete:
-            log("Cloud Function - Waiting for the deployment to complete...")
-            output.result(timeout=300)
+        if not wait_to_complete:
+            # Return the operation straight away, e.g. to wait on several deployments with `wait_all`
+            log("Cloud Function - Deployment of '%s' started.", self.name)
+            return response
+        log("Cloud Function - Waiting for the deployment to complete...")
+        response.result(timeout=300)
         # Check that the function was deployed and is active
-        function = self.get()
+        function = self.get(force_refresh=True)
         service_config = function.service_config
-        print(f"Cloud Function - '{self.name}': {function.state.name}.")
-        if wait_to_complete:
-            print(f"Version: {service_config.revision}")
-            print(f"URI: {service_config.uri}")
+        log("Cloud Function - '%s': %s.", self.name, function.state.name)
+        log("Version: %s", service_config.revision)
+        log("URI: %s", service_config.uri)
+        if service_config.uri:
+            self._uri_cache[self.function_id] = service_config.uri
         return response
 
     def _split_deploy_kwargs(self, kwargs):
@@ -1,12 +1,34 @@
+import os
 import json
-import random
+import time
+import secrets
 
 from gcp_pal.pydocker import Docker
-from gcp_pal.utils import log, ClientHandler, ModuleHandler, get_default_arg
+from gcp_pal.utils import (
+    log,
+    prefetch_pages,
+    await_operation,
+    ClientHandler,
+    ModuleHandler,
+    get_default_arg,
+)
 
 
 class CloudRun:
 
+    # Recently fetched services and jobs keyed by full name, as (fetched_at, object)
+    _get_cache: dict = {}
+    _get_cache_ttl = 5.0
+    # Service URIs keyed by full name. A service keeps its URI across redeployments.
+    _uri_cache: dict = {}
+    # Parsed environment variables keyed by (YAML path, mtime, defaults), so that
+    # deploying many services from the same file only parses it once
+    _env_vars_cache: dict = {}
+    # Full names of the services under each parent, as (fetched_at, names), filled in by
+    # `ls_services` so that `exists` can answer without a `GetService` round trip
+    _services_cache: dict = {}
+    _services_cache_ttl = 60.0
+
     def __init__(
         self,
         name=None,
@@ -37,31 +59,47 @@ class CloudRun:
             who_is_calling="CloudRun"
         )
 
+    def iter_jobs(self, active_only=False, full_id=False):
+        """
+        Iterate over the jobs in the project, fetching the next page while the current one is consumed.
+        """
+        pager = self.jobs_client.list_jobs(parent=self.parent)
+        for page in prefetch_pages(pager.pages):
+            for job in page.jobs:
+                if active_only and job.terminal_condition.type_ != "Ready":
+                    continue
+                yield job.name if full_id else job.name.split("/")[-1]
+
+    def iter_services(self, active_only=False, full_id=False):
+        """
+        Iterate over the services in the project, fetching the next page while the current one is consumed.
+        """
+        pager = self.client.list_services(parent=self.parent)
+        for page in prefetch_pages(pager.pages):
+            for service in page.services:
+                if active_only and not all(
+                    x.percent > 0 for x in service.traffic_statuses
+                ):
+                    continue
+                yield service.name if full_id else service.name.split("/")[-1]
+
     def ls_jobs(self, active_only=False, full_id=False):
         """
         List all jobs in the project.
         """
-        jobs = self.jobs_client.list_jobs(parent=self.parent)
-        if active_only:
-            jobs = [f for f in jobs if f.terminal_condition.type_ == "Ready"]
-        output = [x.name for x in jobs]
-        if not full_id:
-            output = [f.split("/")[-1] for f in output]
-        return output
+        return list(self.iter_jobs(active_only=active_only, full_id=full_id))
 
     def ls_services(self, active_only=False, full_id=False):
         """
         List all services in the project.
         """
-        services = self.client.list_services(parent=self.parent)
         if active_only:
-            services = [
-                f for f in services if all([x.percent > 0 for x in f.traffic_statuses])
-            ]
-        output = [x.name for x in services]
-        if not full_id:
-            output = [f.split("/")[-1] for f in output]
-        return output
+            return list(self.iter_services(active_only=True, full_id=full_id))
+        full_names = list(self.iter_services(full_id=True))
+        self._services_cache[self.parent] = (time.monotonic(), set(full_names))
+        if full_id:
+            return full_names
+        return [name.split("/")[-1] for name in full_names]
 
     def ls(self, active_only=False, full_id=False):
         """
@@ -78,16 +116,30 @@ class CloudRun:
             return self.ls_jobs(active_only=active_only, full_id=full_id)
         return self.ls_services(active_only=active_only, full_id=full_id)
 
-    def get(self):
+    def get(self, force_refresh=False):
         """
-        Get a service or job by name.
+        Get a service or job by name. Results are reused for a few seconds, so that repeated
+        `exists`/`get` calls during a deployment don't each cost a round trip.
+
+        Args:
+        - force_refresh (bool): If True, always fetch the service or job from the API.
 
         Returns:
         - (Service) or (Job): The service or job object.
         """
+        cached = self._get_cache.get(self.full_name)
+        if (
+            cached
+            and not force_refresh
+            and time.monotonic() - cached[0] < self._get_cache_ttl
+        ):
+            return cached[1]
         if self.job:
-            return self.jobs_client.get_job(name=self.full_name)
-        return self.client.get_service(name=self.full_name)
+            output = self.jobs_client.get_job(name=self.full_name)
+        else:
+            output = self.client.get_service(name=self.full_name)
+        self._get_cache[self.full_name] = (time.monotonic(), output)
+        return output
 
     def status(self):
         """
@@ -97,13 +149,13 @@ class CloudRun:
         - (str): The status of the service or job. Either 'Active' or 'Inactive'.
         """
         if self.job:
-            status = self.get().terminal_condition.type_
+            status = self.get(force_refresh=True).terminal_condition.type_
             output = "Active" if status == "Ready" else "Inactive"
-            log(f"Cloud Run - Job '{self.name}' is {output}.")
+            log("Cloud Run - Job '%s' is %s.", self.name, output)
         else:
-            status = self.get().traffic[0].percent > 0
+            status = self.get(force_refresh=True).traffic[0].percent > 0
             output = "Active" if status else "Inactive"
-            log(f"Cloud Run - Service '{self.name}' is {output}.")
+            log("Cloud Run - Service '%s' is %s.", self.name, output)
         return output
 
     def state(self):
@@ -119,6 +171,13 @@ class CloudRun:
         Returns:
         - (bool): True if the service or job exists, False otherwise.
         """
+        cached = self._services_cache.get(self.parent)
+        if (
+            not self.job
+            and cached
+            and time.monotonic() - cached[0] < self._services_cache_ttl
+        ):
+            return self.full_name in cached[1]
         try:
             self.get()
             return True
@@ -196,21 +255,54 @@ class CloudRun:
         )
         service_exists = self.exists()
         if not service_exists:
-            log(f"Cloud Run - Creating service '{self.name}'...")
+            log("Cloud Run - Creating service '%s'...", self.name)
             args = {"parent": self.parent, "service": service, "service_id": self.name}
             request = self.types.CreateServiceRequest(**args)
             response = self.client.create_service(request=request)
+            if self.parent in self._services_cache:
+                self._services_cache[self.parent][1].add(self.full_name)
         else:
-            log(f"Cloud Run - Updating service '{self.name}'...")
+            log("Cloud Run - Updating service '%s'...", self.name)
             # Add 'name' to service.template.containers
             service.name = self.full_name
-            request = self.types.UpdateServiceRequest(service=service)
+            # Only send the fields set here, so the server doesn't reconcile the whole
+            # service and settings made by other tools are left alone
+            mask_paths = ["template.containers", "template.scaling"]
+            mask_paths += [k for k in service_kwargs if k not in mask_paths]
+            request = self.types.UpdateServiceRequest(
+                service=service, update_mask={"paths": mask_paths}
+            )
             response = self.client.update_service(request=request)
+        self._get_cache.pop(self.full_name, None)
         if wait_to_complete:
-            log(f"Cloud Run - Waiting for service '{self.name}' to complete...")
-            response.result(timeout=300)
+            log("Cloud Run - Waiting for service '%s' to complete...", self.name)
+            deployed = response.result(timeout=300)
+            if deployed.uri:
+                self._uri_cache[self.full_name] = deployed.uri
         return response
 
+    async def deploy_service_async(self, **kwargs):
+        """
+        Deploy a Cloud Run service without blocking the event loop while the deployment runs.
+        Awaiting many deployments together overlaps them on a single thread.
+
+        Args:
+        - kwargs: Arguments to pass to `deploy_service`.
+
+        Returns:
+        - (Service): The deployed service.
+        """
+        import asyncio
+
+        kwargs["wait_to_complete"] = False
+        operation = await asyncio.to_thread(self.deploy_service, **kwargs)
+        service = await await_operation(operation)
+        self._get_cache.pop(self.full_name, None)
+        if service.uri:
+            self._uri_cache[self.full_name] = service.uri
+        log("Cloud Run - Service '%s' deployed.", self.name)
+        return service
+
     def deploy_job(
         self,
         image_url=None,
@@ -245,13 +337,26 @@ class CloudRun:
             **job_kwargs,
         )
         response = self.jobs_client.create_job(parent=self.parent, job=job)
+        self._get_cache.pop(self.full_name, None)
         return response
 
     def uri(self):
         """
-        Get the URI of the service.
+        Get the URI of the service. The URI is remembered after the first lookup, so that
+        `call` doesn't need a `GetService` round trip on every invocation.
         """
-        return self.get().uri
+        uri = self._uri_cache.get(self.full_name)
+        if uri is None:
+            uri = self.get().uri
+            if uri:
+                self._uri_cache[self.full_name] = uri
+        return uri
+
+    def invalidate_uri(self):
+        """
+        Forget the remembered URI of the service, e.g. after it was redeployed elsewhere.
+        """
+        self._uri_cache.pop(self.full_name, None)
 
     def call(
         self,
@@ -293,6 +398,29 @@ class CloudRun:
                 pass
         return output
 
+    async def call_async(self, data={}, **kwargs):
+        """
+        Calls the service without blocking the event loop. Awaiting many calls together
+        overlaps their round trips, e.g.:
+        `await asyncio.gather(*[CloudRun(name).call_async(data) for name, data in calls])`
+
+        Args:
+        - data (dict|str): The data to send to the service. Defaults to {}.
+        - kwargs: Additional arguments to pass to `call`.
+
+        Returns:
+        - (dict) The response from the service.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.call, data=data, **kwargs)
+
+    async def invoke_async(self, **kwargs):
+        """
+        Alias for call_async.
+        """
+        return await self.call_async(**kwargs)
+
     def invoke(self, **kwargs):
         """
         Alias for call method.
@@ -307,9 +435,17 @@ class CloudRun:
 
         if yaml_file is None:
             return []
-        data = load_yaml(yaml_file)
-        data = {**default, **data}
-        return [self.types.EnvVar(name=k, value=str(v)) for k, v in data.items()]
+        mtime = os.stat(yaml_file).st_mtime_ns
+        key = (os.path.abspath(yaml_file), mtime, tuple(default.items()))
+        env_vars = self._env_vars_cache.get(key)
+        if env_vars is None:
+            data = load_yaml(yaml_file)
+            data = {**default, **data}
+            env_vars = tuple(
+                self.types.EnvVar(name=k, value=str(v)) for k, v in data.items()
+            )
+            self._env_vars_cache[key] = env_vars
+        return list(env_vars)
 
     def deploy(
         self,
@@ -331,17 +467,16 @@ class CloudRun:
         - (Service) or (Job): The service or job object.
         """
         if image_tag == "random":
-            random_tag = random.getrandbits(64)
-            image_tag = f"{random_tag:x}"
+            image_tag = secrets.token_hex(8)
         if (
             path.startswith("gs:")
             or path.startswith("http")
             or path.startswith("gcr.io/")
         ):
-            log(f"Cloud Run - Deploying {path} directly.")
+            log("Cloud Run - Deploying %s directly.", path)
             image_url = path
         else:
-            log(f"Cloud Run - Building and pushing Docker image from {path}.")
+            log("Cloud Run - Building and pushing Docker image from %s.", path)
             image_url = self.build_and_push_docker_image(
                 path=path, image_tag=image_tag, dockerfile=dockerfile
             )
@@ -371,6 +506,57 @@ class CloudRun:
         """
         return self.deploy(path, image_tag, dockerfile, **kwargs)
 
+    @classmethod
+    def deploy_many(cls, specs, max_concurrency=16):
+        """
+        Deploys several services or jobs at the same time.
+
+        Args:
+        - specs (list): One dict per service or job, holding `name` (and optionally `project`,
+          `location`, `job`) plus the arguments for `deploy`.
+        - max_concurrency (int): The maximum number of deployments in flight at once.
+
+        Returns:
+        - (dict) The result of each deployment keyed by name. Failed deployments map to
+          their exception, so that one failure doesn't abort the rest of the batch.
+
+        Examples:
+        >>> CloudRun.deploy_many([{"name": "a", "path": "a/"}, {"name": "b", "path": "b/"}])
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def deploy_one(spec):
+            spec = dict(spec)
+            init_kwargs = {
+                k: spec.pop(k)
+                for k in ("name", "project", "location", "job")
+                if k in spec
+            }
+            try:
+                return cls(**init_kwargs).deploy(**spec)
+            except Exception as e:
+                log("Cloud Run - Error deploying '%s': %s", init_kwargs.get("name"), e)
+                return e
+
+        specs = list(specs)
+        if not specs:
+            return {}
+        # List the existing services once, instead of one `exists` lookup per deployment
+        parents = {
+            (spec.get("project"), spec.get("location"))
+            for spec in specs
+            if not spec.get("job")
+        }
+        for project, location in parents:
+            try:
+                cls(project=project, location=location).ls_services()
+            except Exception as e:
+                log("Cloud Run - Error listing services: %s", e)
+        max_workers = min(max_concurrency, len(specs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(deploy_one, specs))
+        return {spec["name"]: result for spec, result in zip(specs, results)}
+
     def delete(self, wait_to_complete=True, errors="ignore"):
         """
         Delete a service or job.
@@ -378,20 +564,24 @@ class CloudRun:
         Returns:
         - None
         """
+        self._get_cache.pop(self.full_name, None)
+        self.invalidate_uri()
+        if self.parent in self._services_cache:
+            self._services_cache[self.parent][1].discard(self.full_name)
         try:
             if self.job:
                 result = self.jobs_client.delete_job(name=self.full_name)
                 if wait_to_complete:
                     result.result()
-                log(f"Cloud Run - Deleted job '{self.name}'.")
+                log("Cloud Run - Deleted job '%s'.", self.name)
             else:
                 result = self.client.delete_service(name=self.full_name)
                 if wait_to_complete:
                     result.result()
-                log(f"Cloud Run - Deleted service '{self.name}'.")
+                log("Cloud Run - Deleted service '%s'.", self.name)
         except self.exceptions.NotFound:
             if errors == "ignore":
-                log(f"Cloud Run - Service '{self.name}' not found to delete.")
+                log("Cloud Run - Service '%s' not found to delete.", self.name)
                 return None
             else:
                 raise
@@ -9,6 +9,8 @@ PYPI_NAMES = {
     "google.cloud.logging": "google-cloud-logging",
     "google.cloud.pubsub_v1": "google-cloud-pubsub",
     "google.cloud.bigquery": "google-cloud-bigquery",
+    "google.cloud.bigquery_storage": "google-cloud-bigquery-storage",
+    "google.cloud.bigquery_storage_v1": "google-cloud-bigquery-storage",
     "google.cloud.datastore": "google-cloud-datastore",
     "google.cloud.firestore": "google-cloud-firestore",
     "google.cloud.dataplex_v1": "google-cloud-dataplex",
@@ -25,6 +27,7 @@ PYPI_NAMES = {
     "docker": "docker",
     "pyarrow": "pyarrow",
     "pandas_gbq": "pandas-gbq",
+    "orjson": "orjson",
 }
 DEFAULT_ARGS = {
     "location": "europe-west2",
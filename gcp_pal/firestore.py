@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
+import time
+import threading
 import concurrent.futures
 from gcp_pal.utils import try_import
 
@@ -13,12 +16,38 @@ from gcp_pal.utils import (
     get_default_arg,
 )
 
+_DataFrame = None
+
+
+def _get_dataframe():
+    """
+    Import pandas' DataFrame on first use and remember it for later calls.
+
+    Returns:
+    - type: The pandas DataFrame class
+    """
+    global _DataFrame
+    if _DataFrame is None:
+        _DataFrame = try_import("pandas", "Firestore").DataFrame
+    return _DataFrame
+
 
 class Firestore:
     """
     Class for operating Firestore
     """
 
+    # Documents read with `source="cache"`, keyed by (project, path), as (read_at, data)
+    _read_cache = {}
+    _read_cache_ttl = 60.0
+    # Number of documents fetched per page when deleting a collection
+    _delete_page_size = 500
+    # Attempts per BulkWriter operation before it counts as failed (BulkWriter's default)
+    _bulk_write_attempts = 15
+    # Stop events of the running keep-alive threads, keyed by project
+    _keepalive_events = {}
+    _keepalive_lock = threading.Lock()
+
     def __init__(self, path=None, project=None):
         """
         Args:
@@ -34,7 +63,14 @@ class Firestore:
         - `Firestore("gs://project/bucket/path").delete()` -> Delete from Firestore "bucket/path"
         """
         self.project = project or get_default_arg("project")
+        self.bucket = None
         self.path = path
+        if path is not None and "gs://" in path:
+            # gs://project/bucket/path -> project, bucket, path
+            # path -> collection/document/../collection/document
+            self.bucket, self.path = path.replace("gs://", "").split("/", 1)
+        self._parsed_path = None
+        self._path_elements = None
 
         # Only initialize the client once per project
         self.firestore = ModuleHandler("google.cloud").please_import(
@@ -47,25 +83,24 @@ class Firestore:
 
     def _parse_path(self, method="get"):
         """
-        Parse the path into project, bucket, and path. This allows Firestore to be used in the same way as GCS.
+        Split the path into its elements. `gs://` paths are normalised in `__init__`,
+        which allows Firestore to be used in the same way as GCS.
 
         Returns:
-        - Path elements (list): List of alternating path elements [collection, document, collection, ...]
+        - Path elements (tuple): Alternating path elements [collection, document, collection, ...]
 
         Examples:
-        - Firestore("collection/document")._parse_path() -> ["collection", "document"]
-        - Firestore("gs://project/bucket/collection/document")._parse_path() -> ["collection", "document"]
-        - Firestore("gs://project/bucket/output/data.csv")._parse_path() -> ["output", "data.csv"]
+        - Firestore("collection/document")._parse_path() -> ("collection", "document")
+        - Firestore("gs://project/bucket/collection/document")._parse_path() -> ("collection", "document")
+        - Firestore("gs://project/bucket/output/data.csv")._parse_path() -> ("output", "data.csv")
         """
         if self.path is None:
             return None
-        if "gs://" in self.path:
-            # gs://project/bucket/path -> project, bucket, path
-            # path -> collection/document/../collection/document
-            self.path = self.path.replace("gs://", "")
-            self.bucket, self.path = self.path.split("/", 1)
-        path_elements = self.path.split("/")
-        return path_elements
+        # Only re-split when the path has changed, e.g. after `ls(path)`
+        if self._parsed_path != self.path:
+            self._path_elements = tuple(self.path.split("/"))
+            self._parsed_path = self.path
+        return self._path_elements
 
     def get(self, method=None):
         """
@@ -81,14 +116,56 @@ class Firestore:
         path_elements = self._parse_path(method)
         if path_elements is None:
             return None
-        doc_ref = self.client.collection(path_elements.pop(0))
-        ref_type = "document"
-        while len(path_elements) > 0:
-            doc_ref = getattr(doc_ref, ref_type)(path_elements.pop(0))
-            ref_type = "document" if ref_type == "collection" else "collection"
-        return doc_ref
+        return self._ref_from_path(path_elements)
+
+    def _ref_from_path(self, path_elements):
+        """
+        Build a reference from path elements, without touching `self.path`.
+
+        Args:
+        - path_elements (tuple): Alternating path elements [collection, document, ...]
+
+        Returns:
+        - Firestore reference (DocumentReference or CollectionReference)
+        """
+        ref = self.client.collection(path_elements[0])
+        elements = iter(path_elements[1:])
+        # Elements alternate document, collection, document, ...
+        for document_id in elements:
+            ref = ref.document(document_id)
+            collection_id = next(elements, None)
+            if collection_id is None:
+                break
+            ref = ref.collection(collection_id)
+        return ref
+
+    def read_many(self, paths):
+        """
+        Read several documents in a single batched request.
+
+        Args:
+        - paths (list): Paths of the documents to read, e.g. ["coll/doc1", "coll/doc2"]
 
-    def async_read(self, paths_list, allow_empty=False, apply_schema=False, schema={}):
+        Returns:
+        - dict: Document data keyed by document path. Missing documents map to None.
+
+        Examples:
+        - Firestore().read_many(["coll/doc1", "coll/doc2"]) -> {"coll/doc1": {...}, ...}
+        """
+        doc_refs = [self._ref_from_path(path.split("/")) for path in paths]
+        snapshots = self.client.get_all(doc_refs)
+        output = {snap.reference.path: snap.to_dict() for snap in snapshots}
+        log(f"Firestore - read {len(output)} documents")
+        return output
+
+    def async_read(
+        self,
+        paths_list,
+        allow_empty=False,
+        apply_schema=False,
+        schema={},
+        source="server",
+    ):
         """
         Read a list of paths from Firestore asynchronously.
 
@@ -97,14 +174,16 @@ class Firestore:
         - allow_empty (bool): If True, return an empty DataFrame if the document is empty
         - apply_schema (bool): If True, apply the schema from FIRESTORE_SCHEMAS.
                                Also converts the output to a DataFrame.
+        - source (str): "server" or "cache". See `read`.
         """
         with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
             futures = [
                 executor.submit(
-                    Firestore(path).read,
+                    Firestore(path, project=self.project).read,
                     allow_empty=allow_empty,
                     apply_schema=apply_schema,
                     schema=schema,
+                    source=source,
                 )
                 for path in paths_list
             ]
@@ -115,7 +194,14 @@ class Firestore:
             }
         return output
 
-    def read(self, allow_empty=False, apply_schema=False, schema={}, path_schemas={}):
+    def read(
+        self,
+        allow_empty=False,
+        apply_schema=False,
+        schema={},
+        path_schemas={},
+        source="server",
+    ):
         """
         Read from Firestore
 
@@ -125,6 +211,8 @@ class Firestore:
                                Also converts the output to a DataFrame.
         - schema (dict): Schema to enforce on the output
         - path_schemas (dict): Schemas to enforce on specific paths.
+        - source (str): "server" always reads from Firestore. "cache" returns a document
+                        read in this process within the last minute, if there is one.
 
         Returns:
         - Output from Firestore (DataFrame or dict)
@@ -147,8 +235,9 @@ class Firestore:
                 allow_empty=allow_empty,
                 apply_schema=apply_schema,
                 schema=schema,
+                source=source,
             )
-        output = doc_ref.get().to_dict()
+        output = self._read_document(doc_ref, source=source)
         metadata = {}
         object_type = None
         dtypes = None
@@ -163,15 +252,50 @@ class Firestore:
                 apply_schema = True
         if apply_schema:
             if object_type == "<class 'pandas.core.frame.DataFrame'>":
-                try_import("pandas", "DataFrame")
-                from pandas import DataFrame
-
-                output = DataFrame(output)
+                output = _get_dataframe()(output)
                 output = output.reset_index(drop=True)
             output = enforce_schema(output, schema=schema, dtypes=dtypes)
         log(f"Firestore - read {self.path}")
         return output
 
+    def _read_document(self, doc_ref, source="server"):
+        """
+        Read a document as a dict, going through the in-process cache for "cache".
+
+        Args:
+        - doc_ref (DocumentReference): Reference to the document
+        - source (str): "server" or "cache"
+
+        Returns:
+        - dict or None: The document data
+        """
+        if source not in ("server", "cache"):
+            raise ValueError(f"Unsupported source: {source}. Use 'server' or 'cache'.")
+        key = (self.project, doc_ref.path)
+        cached = Firestore._read_cache.get(key)
+        if (
+            source == "cache"
+            and cached
+            and time.monotonic() - cached[0] < self._read_cache_ttl
+        ):
+            return copy.deepcopy(cached[1])
+        output = doc_ref.get().to_dict()
+        if source == "cache" or key in Firestore._read_cache:
+            Firestore._read_cache[key] = (time.monotonic(), copy.deepcopy(output))
+        return output
+
+    def _invalidate_read_cache(self):
+        """
+        Drop cached reads of this document or collection and everything below it.
+        """
+        prefix = self.path + "/"
+        for key in list(Firestore._read_cache):
+            project, path = key
+            if project != self.project:
+                continue
+            if path == self.path or path.startswith(prefix):
+                Firestore._read_cache.pop(key, None)
+
     def write(self, data, columns=None):
         """
         Write to Firestore
@@ -187,14 +311,21 @@ class Firestore:
         - Firestore("coll/doc").write(data) -> Write data to Firestore "coll/doc"
         """
         doc_ref = self.get(method="set")
+        self._invalidate_read_cache()
         dtypes, object_type = None, None
         object_type = str(type(data))
         if is_dataframe(data):
             if columns is not None:
                 data = data[columns]
-            data.reset_index(drop=True, inplace=True)
+            data = data.reset_index(drop=True)
             dtypes = data.dtypes.astype(str).to_dict()
-            data = data.to_json()
+            output = {
+                "data": self._dataframe_to_dict(data),
+                "metadata": {"dtypes": dtypes, "object_type": object_type},
+            }
+            doc_ref.set(output)
+            log(f"Firestore - written {self.path}")
+            return True
         try:
             doc_ref.set(data)
         except ValueError as e:
@@ -203,7 +334,6 @@ class Firestore:
         except AttributeError as e:
             # This happens if the data is a list of dictionaries
             if isinstance(data, str):
-                # This happens if the data came from DataFrame.to_json()
                 data = json.loads(data)
             output = {"data": data, "metadata": {}}
             if dtypes is not None:
@@ -214,6 +344,65 @@ class Firestore:
         log(f"Firestore - written {self.path}")
         return True
 
+    @staticmethod
+    def _dataframe_to_dict(data):
+        """
+        Convert a DataFrame to the stored form `{column: {row_number: value}}`, the same
+        layout as `json.loads(data.to_json())`, without the round trip through a string.
+
+        Args:
+        - data (DataFrame): DataFrame with a default (0..n-1) index
+
+        Returns:
+        - dict: The DataFrame as a dict
+        """
+        is_plain = [Firestore._is_plain_column(values) for _, values in data.items()]
+        if not any(is_plain):
+            return json.loads(data.to_json())
+        # Columns of other values (dates, decimals, arrays, ...) keep the encoding of
+        # to_json, e.g. epoch milliseconds for dates
+        output = {}
+        if not all(is_plain):
+            output = json.loads(data.loc[:, [not p for p in is_plain]].to_json())
+        plain = data.loc[:, is_plain]
+        # to_json writes missing and non-finite values (NaN, NA, None, +/-inf) as null
+        inf = float("inf")
+        plain = plain.replace([inf, -inf], float("nan"))
+        plain = plain.astype(object).where(plain.notna(), None)
+        index = [str(i) for i in range(len(plain))]
+        for column, values in plain.to_dict(orient="list").items():
+            output[str(column)] = dict(zip(index, values))
+        return {str(column): output[str(column)] for column in data.columns}
+
+    @staticmethod
+    def _is_plain_column(values):
+        """
+        Check whether a column only holds numbers, booleans or strings, which are stored
+        as they are rather than through `to_json`.
+
+        Args:
+        - values (Series): The column
+
+        Returns:
+        - bool: True if the column can be stored as it is
+        """
+        from pandas.api.types import (
+            infer_dtype,
+            is_bool_dtype,
+            is_complex_dtype,
+            is_numeric_dtype,
+            is_object_dtype,
+        )
+
+        dtype = values.dtype
+        if is_bool_dtype(dtype):
+            return True
+        if is_numeric_dtype(dtype):
+            return not is_complex_dtype(dtype)
+        if is_object_dtype(dtype) or dtype == "string":
+            return infer_dtype(values, skipna=True) in ("string", "empty")
+        return False
+
     def create(self, **kwargs):
         """
         Create an empty Firestore document or collection.
@@ -234,6 +423,8 @@ class Firestore:
         Recursively deletes documents and collections from Firestore.
         """
         ref = self.get()
+        if ref is not None:
+            self._invalidate_read_cache()
         ref_type = self._ref_type(ref)
         if ref_type == "document":
             self._delete_document(ref)
@@ -248,21 +439,84 @@ class Firestore:
         """
         Deletes a document and all of its collections.
         """
-        collections = doc_ref.collections()
-        for collection in collections:
-            self._delete_collection(collection)
-        doc_ref.delete()
+        bulk_writer, failures = self._bulk_writer()
+        for collection in doc_ref.collections():
+            self._delete_collection(collection, bulk_writer=bulk_writer)
+        bulk_writer.delete(doc_ref)
+        self._close_bulk_writer(bulk_writer, failures)
 
-    def _delete_collection(self, col_ref):
+    def _delete_collection(self, col_ref, bulk_writer=None):
         """
-        Deletes a collection and all of its documents.
+        Deletes a collection and all of its documents. The deletes are queued on a
+        BulkWriter, which commits them in batches rather than one RPC per document.
+
+        Args:
+        - col_ref (CollectionReference): The collection to delete
+        - bulk_writer (BulkWriter): Writer to queue the deletes on. If None, a new one is
+                                    created and flushed before returning.
         """
-        docs = col_ref.stream()
+        owns_writer = bulk_writer is None
+        if owns_writer:
+            bulk_writer, failures = self._bulk_writer()
+        # Only fetch document names, a page at a time, rather than every full document
+        query = col_ref.select(["__name__"]).limit(self._delete_page_size)
+        docs = list(query.stream())
         with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
-            futures = [
-                executor.submit(self._delete_document, doc.reference) for doc in docs
-            ]
-            concurrent.futures.wait(futures)
+            while docs:
+                # Listing sub-collections is one RPC per document, so fan those out
+                sub_collections = executor.map(
+                    lambda doc: list(doc.reference.collections()), docs
+                )
+                for collections in sub_collections:
+                    for collection in collections:
+                        self._delete_collection(collection, bulk_writer=bulk_writer)
+                for doc in docs:
+                    bulk_writer.delete(doc.reference)
+                if len(docs) < self._delete_page_size:
+                    break
+                docs = list(query.start_after(docs[-1]).stream())
+        if owns_writer:
+            self._close_bulk_writer(bulk_writer, failures)
+
+    def _bulk_writer(self):
+        """
+        Create a BulkWriter which records the operations that still fail after being
+        retried. BulkWriter drops those without raising, so pass the returned list to
+        `_close_bulk_writer` to check them.
+
+        Returns:
+        - tuple: (BulkWriter, list of BulkWriteFailure)
+        """
+        failures = []
+
+        def on_write_error(error, bulk_writer):
+            if error.attempts < self._bulk_write_attempts:
+                return True
+            failures.append(error)
+            return False
+
+        bulk_writer = self.client.bulk_writer()
+        bulk_writer.on_write_error(on_write_error)
+        return bulk_writer, failures
+
+    def _close_bulk_writer(self, bulk_writer, failures):
+        """
+        Flush and close a BulkWriter, raising if any of its operations failed.
+
+        Args:
+        - bulk_writer (BulkWriter): The writer from `_bulk_writer`
+        - failures (list): The failures list from `_bulk_writer`
+        """
+        bulk_writer.close()
+        if not failures:
+            return
+        exceptions = ModuleHandler("google.api_core.exceptions").please_import(
+            who_is_calling="Firestore"
+        )
+        error = failures[0]
+        message = f"{len(failures)} write(s) failed, e.g.: {error.message}"
+        log(f"Firestore - Error: {message}")
+        raise exceptions.from_grpc_status(error.code, message)
 
     def _ref_type(self, doc_ref):
         is_doc_ref = isinstance(doc_ref, self.firestore.DocumentReference)
@@ -310,6 +564,44 @@ class Firestore:
             raise ValueError("Unsupported Firestore reference type.")
         return exists
 
+    def keep_alive(self, interval=30):
+        """
+        Keep the connection to Firestore warm in a long-lived worker by making a tiny
+        request every `interval` seconds from a daemon thread. gRPC only sends keepalive
+        pings while a call is active, so an idle connection is otherwise dropped and the
+        next read pays for a new connection. Only one thread is started per project.
+
+        Args:
+        - interval (int): Seconds between requests. Default is 30.
+
+        Returns:
+        - threading.Event: Set it to stop the keep-alive thread.
+
+        Examples:
+        - stop = Firestore().keep_alive() -> Start keeping the connection warm
+        - stop.set() -> Stop
+        """
+        with Firestore._keepalive_lock:
+            stop = Firestore._keepalive_events.get(self.project)
+            if stop is not None and not stop.is_set():
+                return stop
+            stop = threading.Event()
+            Firestore._keepalive_events[self.project] = stop
+        client = self.client
+
+        def ping():
+            while not stop.wait(interval):
+                try:
+                    # Fetch the first collection ID. Unlike a query on a made-up
+                    # collection, this cannot be rejected (IDs like __x__ are reserved)
+                    next(iter(client.collections()), None)
+                except Exception as e:
+                    log("Firestore - keep-alive request failed: %s", e)
+
+        threading.Thread(target=ping, name="firestore-keepalive", daemon=True).start()
+        log("Firestore - keep-alive started for %s", self.project)
+        return stop
+
 
 if __name__ == "__main__":
     data = {
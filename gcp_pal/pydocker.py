@@ -1,9 +1,15 @@
+import threading
+
 from gcp_pal.utils import log, ModuleHandler, get_default_arg
 
 
 class Docker:
 
+    # One daemon client shared by all instances. Its connection pool is sized so that
+    # concurrent builds (e.g. from `CloudRun.deploy_many`) reuse sockets to the daemon.
     _client = None
+    _client_lock = threading.Lock()
+    _max_pool_size = 32
 
     def __init__(
         self,
@@ -25,11 +31,6 @@ class Docker:
         - repository (str): The name of the Artifact Registry repository. Defaults to 'docker'.
         """
         self.docker = ModuleHandler("docker").please_import(who_is_calling="Docker")
-        if self._client is None:
-            self.client = self.docker.from_env()
-            Docker._client = self.client
-        else:
-            self.client = self._client
 
         self.project = project or get_default_arg("project")
         self.location = location or get_default_arg("location")
@@ -41,6 +42,20 @@ class Docker:
         self.default_dest = gcr_dest
         self.destination = destination or self.default_dest
 
+    @property
+    def client(self):
+        """
+        The Docker daemon client, created on first use (which pings the daemon) and then
+        shared by all instances.
+        """
+        if Docker._client is None:
+            with Docker._client_lock:
+                if Docker._client is None:
+                    Docker._client = self.docker.from_env(
+                        max_pool_size=self._max_pool_size
+                    )
+        return Docker._client
+
     def build(self, path=".", dockerfile="Dockerfile", verbose=False, **kwargs):
         """
         Build a Docker image from a Dockerfile.
@@ -49,28 +64,45 @@ class Docker:
         - path (str): The path to the build context.
         - dockerfile (str): The relative path to the Dockerfile from the context path.
         - verbose (bool): Whether to stream the output of the build command.
-        - kwargs: Additional arguments to pass to the Docker images build command.
+        - kwargs: Additional arguments to pass to the Docker API build command.
 
         Returns:
         - None
+
+        Raises:
+        - docker.errors.BuildError: If the build fails.
         """
         log(f"Docker - Building image '{self.name}:{self.tag}' from {dockerfile}...")
-        _, output = self.client.images.build(
+        # The low-level API yields build events as they arrive, rather than collecting
+        # the whole log first
+        output = self.client.api.build(
             path=path,
             tag=self.destination,
             dockerfile=dockerfile,
+            decode=True,
             **kwargs,
         )
-        if verbose:
-            for line in output:
-                log(line)
-        # Check for success
+        # Log and check for success in a single pass. Failures raise `BuildError`, as
+        # `images.build` does, so that nothing is pushed after a failed build
+        success = False
+        build_log = []
         for line in output:
+            build_log.append(line)
+            if verbose:
+                log(line)
+            if "error" in line:
+                log(f"Docker - Error: {line['error']}")
+                raise self.docker.errors.BuildError(line["error"], build_log)
             stream = line.get("stream")
             if stream is not None and "Successfully built" in stream:
-                log(f"Docker - Image '{self.name}:{self.tag}' built successfully.")
-                return
-        log(f"Docker - Image '{self.name}:{self.tag}' failed to build.")
+                success = True
+            elif "ID" in line.get("aux", {}):
+                # BuildKit reports the image ID instead of a "Successfully built" line
+                success = True
+        if not success:
+            log(f"Docker - Image '{self.name}:{self.tag}' failed to build.")
+            raise self.docker.errors.BuildError("Unknown", build_log)
+        log(f"Docker - Image '{self.name}:{self.tag}' built successfully.")
         return
 
     def push(self, verbose=False, destination=None, **kwargs):
@@ -80,22 +112,24 @@ class Docker:
         Args:
         - verbose (bool): Whether to stream the output of the push command.
         - destination (str): The destination of the pushed image. Defaults to gcr.io/{project}/{name}:{tag}.
-        - kwargs: Additional arguments to pass to the Docker images push command.
+        - kwargs: Additional arguments to pass to the Docker API push command.
 
         Returns:
         - (str) The destination of the pushed image (or None if an error occurred)
         """
         destination = destination or self.destination
         log(f"Docker - Pushing image to {destination}...")
-        stream = True if verbose else False
-        output = self.client.images.push(
+        # Always stream: otherwise the output is one string and errors in it are missed
+        output = self.client.api.push(
             destination,
-            stream=stream,
+            stream=True,
             decode=True,
             **kwargs,
         )
-        # Check for success
+        # Log and check for errors in a single pass
         for line in output:
+            if verbose:
+                log(line)
             if "error" in line:
                 log(f"Docker - Error: {line}")
                 return
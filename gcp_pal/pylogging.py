@@ -1,10 +1,23 @@
 import time
+import heapq
+import itertools
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from gcp_pal.utils import log, ClientHandler, ModuleHandler, get_default_arg
 
 
 class LogEntry:
+    __slots__ = (
+        "project",
+        "log_name",
+        "resource",
+        "severity",
+        "message",
+        "timestamp",
+        "_ts_str",
+    )
+
     def __init__(self, project, log_name, resource, severity, message, timestamp):
         self.project = project
         self.log_name = log_name
@@ -12,12 +25,45 @@ class LogEntry:
         self.severity = severity
         self.message = message
         self.timestamp = timestamp
-        self.time_zone = timestamp.tzinfo
-        self.timestamp_str = (
-            timestamp.isoformat(sep=" ", timespec="milliseconds").split("+")[0]
-            + f" {self.time_zone}"
+        self._ts_str = None
+
+    @classmethod
+    def from_api(cls, log_entry):
+        """
+        Create a LogEntry from an entry returned by the Cloud Logging client.
+
+        Args:
+        - log_entry (google.cloud.logging.LogEntry): Entry returned by `list_entries`
+
+        Returns:
+        - (LogEntry): The log entry
+        """
+        return cls(
+            project=log_entry.resource.labels["project_id"],
+            log_name=log_entry.log_name,
+            resource=log_entry.resource,
+            severity=log_entry.severity,
+            message=log_entry.payload,
+            timestamp=log_entry.timestamp,
         )
-        self.message_str = self._parse_message()
+
+    @property
+    def time_zone(self):
+        return self.timestamp.tzinfo
+
+    @property
+    def timestamp_str(self):
+        # Formatted on first access only, as most entries are never printed
+        if self._ts_str is None:
+            self._ts_str = (
+                self.timestamp.isoformat(sep=" ", timespec="milliseconds").split("+")[0]
+                + f" {self.time_zone}"
+            )
+        return self._ts_str
+
+    @property
+    def message_str(self):
+        return self._parse_message()
 
     def to_dict(self):
         return {
@@ -32,16 +78,7 @@ class LogEntry:
         }
 
     def to_api_repr(self):
-        return {
-            "project": self.project,
-            "log_name": self.log_name,
-            "resource": self.resource,
-            "severity": self.severity,
-            "message": self.message,
-            "timestamp": self.timestamp,
-            "timestamp_str": self.timestamp_str,
-            "message_str": self.message_str,
-        }
+        return self.to_dict()
 
     def _parse_message(self):
         if isinstance(self.message, dict) and "message" in self.message:
@@ -57,9 +94,12 @@ class LogEntry:
 
 class Logging:
 
+    # Time windows longer than this are fetched as parallel sub-windows
+    _split_threshold = datetime.timedelta(minutes=10)
+    _split_count = 8
+
     def __init__(self, project=None):
         self.project = project or get_default_arg("project")
-        self.filters = []
 
         self.loggingClient = ModuleHandler("google.cloud").please_import(
             "logging", who_is_calling="Logging"
@@ -94,28 +134,78 @@ class Logging:
         if time_range:
             time_end = datetime.datetime.now(datetime.timezone.utc)
             time_start = time_end - datetime.timedelta(hours=time_range)
+        if limit is None and self._should_split(time_start, time_end):
+            return self._ls_parallel(query, severity, time_start, time_end, order_by)
         query = self._generate_query(query, severity, time_start, time_end)
         log(f"Logging - Filter: {query}")
         if limit is None and query is None:
             limit = 100
+        return self._list_entries(query, limit=limit, order_by=order_by)
+
+    def _should_split(self, time_start, time_end):
+        if not isinstance(time_start, datetime.datetime):
+            return False
+        if not isinstance(time_end, datetime.datetime):
+            return False
+        return time_end - time_start > self._split_threshold
+
+    def _ls_parallel(self, query, severity, time_start, time_end, order_by):
+        """
+        Fetch a long time window as equal sub-windows in parallel and merge the results.
+
+        Args:
+        - query (str): Query for filtering results
+        - severity (str): Severity level
+        - time_start (datetime.datetime): Start time for logs
+        - time_end (datetime.datetime): End time for logs
+        - order_by (str): Order logs by ascending or descending.
+
+        Returns:
+        - (list[LogEntry]): List of log entries
+        """
+        base_query = self._generate_query(query, severity)
+        step = (time_end - time_start) / self._split_count
+        bounds = [time_start + i * step for i in range(self._split_count)]
+        bounds.append(time_end)
+        queries = []
+        for i in range(self._split_count):
+            # Sub-windows are half-open so that no entry is fetched twice
+            end_op = "<=" if i == self._split_count - 1 else "<"
+            filters = [
+                f'timestamp>="{bounds[i].isoformat()}"',
+                f'timestamp{end_op}"{bounds[i + 1].isoformat()}"',
+            ]
+            if base_query:
+                filters.insert(0, base_query)
+            queries.append(" AND ".join(filters))
+        log("Logging - Fetching %d sub-windows in parallel", len(queries))
+        with ThreadPoolExecutor(max_workers=self._split_count) as executor:
+            results = list(
+                executor.map(
+                    lambda q: self._list_entries(q, limit=None, order_by=order_by),
+                    queries,
+                )
+            )
+        descending = "desc" in (order_by or "").lower()
+        merged = heapq.merge(
+            *results, key=lambda entry: entry.timestamp, reverse=descending
+        )
+        return list(merged)
+
+    def _list_entries(self, query, limit=None, order_by="timestamp desc"):
         logs = self.client.list_entries(
             filter_=query, max_results=limit, order_by=order_by
         )
-        output = []
-        for log_entry in logs:
-            output.append(
-                LogEntry(
-                    project=log_entry.resource.labels["project_id"],
-                    log_name=log_entry.log_name,
-                    resource=log_entry.resource,
-                    severity=log_entry.severity,
-                    message=log_entry.payload,
-                    timestamp=log_entry.timestamp,
-                )
-            )
-        return output
+        return [LogEntry.from_api(log_entry) for log_entry in logs]
 
-    def stream(self, query=None, severity=None, time_start=None, interval=5):
+    def stream(
+        self,
+        query=None,
+        severity=None,
+        time_start=None,
+        interval=5,
+        max_per_poll=10_000,
+    ):
         """
         Stream logs in a project in real-time by polling the log entries.
 
@@ -124,6 +214,8 @@ class Logging:
         - severity (str): Severity level. Default is None.
         - time_start (datetime.datetime): Start time for logs. Default is now.
         - interval (int): Polling interval in seconds. Default is 5 seconds.
+        - max_per_poll (int): Maximum number of entries fetched per poll. If a burst
+            exceeds it, the next poll resumes from the last entry seen. Default is 10,000.
 
         Yields:
         - (LogEntry): Yield log entries as they are found.
@@ -138,6 +230,7 @@ class Logging:
         )
         log(f"Logging - Start Time: {time_start_str}. Streaming...")
 
+        boundary_ids = set()
         while True:
             current_time = datetime.datetime.now(datetime.timezone.utc)
             # Buffer to account for GCP log latency
@@ -150,45 +243,57 @@ class Logging:
             log_filter = self._generate_query(
                 query, severity, last_end_time.isoformat(), time_end.isoformat()
             )
-            logs = self.client.list_entries(filter_=log_filter)
-
-            for log_entry in logs:
-                le = LogEntry(
-                    project=log_entry.resource.labels["project_id"],
-                    log_name=log_entry.log_name,
-                    resource=log_entry.resource,
-                    severity=log_entry.severity,
-                    message=log_entry.payload,
-                    timestamp=log_entry.timestamp,
-                )
-                print(le)
+            logs = self.client.list_entries(
+                filter_=log_filter,
+                order_by="timestamp asc",
+                max_results=max_per_poll,
+                page_size=min(max_per_poll, 1000),
+            )
+
+            n_entries = 0
+            last_seen = None  # Timestamp of the latest entry yielded
+            seen_at_last = set()  # Insert IDs of the entries at that timestamp
+            for log_entry in itertools.islice(logs, max_per_poll):
+                n_entries += 1
+                if log_entry.insert_id in boundary_ids:
+                    continue  # Already yielded in the previous (capped) poll
+                yield LogEntry.from_api(log_entry)
+                if log_entry.timestamp != last_seen:
+                    last_seen = log_entry.timestamp
+                    seen_at_last = set()
+                seen_at_last.add(log_entry.insert_id)
 
+            if n_entries >= max_per_poll and last_seen is not None:
+                # Capped: resume from the last entry seen rather than skipping ahead
+                if last_seen != last_end_time:
+                    boundary_ids = set()
+                boundary_ids |= seen_at_last
+                last_end_time = last_seen
+                continue
             last_end_time = time_end  # Shift the time window
+            boundary_ids = set()
             time.sleep(interval)
 
     def _generate_query(
         self, query=None, severity=None, time_start=None, time_end=None
     ):
+        # Built locally so that concurrent calls don't share state
+        parts = []
         if query:
-            self.filters.append(query)
+            parts.append(query)
         if severity:
-            filter_str = f"severity={severity}"
-            self.filters.append(filter_str)
+            parts.append(f"severity={severity}")
         if time_start:
             if not isinstance(time_start, str):
                 time_start = time_start.isoformat()
-            filter_str = f'timestamp>="{time_start}"'
-            self.filters.append(filter_str)
+            parts.append(f'timestamp>="{time_start}"')
         if time_end:
             if not isinstance(time_end, str):
                 time_end = time_end.isoformat()
-            filter_str = f'timestamp<="{time_end}"'
-            self.filters.append(filter_str)
-        query = " AND ".join(self.filters)
-        self.filters = []  # Reset filters
-        query = None if query == "" else query
-        return query
+            parts.append(f'timestamp<="{time_end}"')
+        return " AND ".join(parts) or None
 
 
 if __name__ == "__main__":
-    Logging().stream()
+    for entry in Logging().stream():
+        print(entry)
@@ -1,10 +1,12 @@
+import types
+import functools
 from datetime import datetime, date, time
 from gcp_pal.utils import (
     force_list,
     is_series,
     is_dataframe,
     log,
-    reverse_dict,
+    try_import,
     is_pyarrow_schema,
     is_bigquery_schema,
     is_python_schema,
@@ -12,6 +14,97 @@ from gcp_pal.utils import (
 )
 
 
+# Equivalent types in each supported system, keyed by target system. These lookup
+# tables are built once at import and shared by every caller, so they are read-only.
+SCHEMA_DICTS = {
+    "str": {
+        "int": "int",
+        "float": "float",
+        "str": "str",
+        "bool": "bool",
+        "timestamp": "timestamp",
+        "date": "date",
+        "time": "time",
+        "datetime": "datetime",
+        "bytes": "bytes",
+        "array": "array",
+        "struct": "struct",
+        "null": "null",
+    },
+    "python": {
+        "int": int,
+        "float": float,
+        "str": str,
+        "bool": bool,
+        "timestamp": datetime,
+        "date": date,
+        "time": time,
+        "datetime": datetime,
+        "bytes": bytes,
+        "array": list,
+        "struct": dict,
+        "null": type(None),
+    },
+    "bigquery": {
+        "null": "BOOLEAN",
+        "int": "INTEGER",
+        "float": "FLOAT",
+        "str": "STRING",
+        "bool": "BOOLEAN",
+        "timestamp": "TIMESTAMP",
+        "date": "DATE",
+        "time": "TIME",
+        "datetime": "DATETIME",
+        "bytes": "BYTES",
+        "array": "ARRAY",
+        "struct": "STRUCT",
+    },
+    "pandas": {
+        "int": "Int64",
+        "float": "Float64",
+        "str": "string",
+        "bool": "boolean",
+        "timestamp": "datetime64[ns]",
+        "date": "datetime64[ns]",
+        "time": "datetime64[ns]",
+        "datetime": "datetime64[ns]",
+        "bytes": "bytes",
+        "array": "list",
+        "struct": "struct",
+        "null": "object",
+    },
+    "pyarrow": {
+        "int": "int64",
+        "float": "double",
+        "str": "string",
+        "bool": "bool",
+        "timestamp": "timestamp[ns]",
+        "date": "date32",
+        "time": "time64[ns]",
+        "datetime": "timestamp[ns]",
+        "bytes": "binary",
+        "array": "list",
+        "struct": "struct",
+        "null": "null",
+    },
+}
+# The same tables mapping back to "str" types. As with `reverse_dict`, the last key wins
+# where several types share a value (e.g. "timestamp" and "datetime").
+REVERSED_SCHEMA_DICTS = {
+    target: types.MappingProxyType({value: key for key, value in schema_dict.items()})
+    for target, schema_dict in SCHEMA_DICTS.items()
+}
+SCHEMA_DICTS = {
+    target: types.MappingProxyType(schema_dict)
+    for target, schema_dict in SCHEMA_DICTS.items()
+}
+# The set of types in each system, for quick membership checks
+SCHEMA_VALUE_SETS = {
+    target: frozenset(schema_dict.values())
+    for target, schema_dict in SCHEMA_DICTS.items()
+}
+
+
 def get_equivalent_schema_dict(target):
     """
     Get the equivalent schema dictionary in the target system.
@@ -20,85 +113,28 @@ def get_equivalent_schema_dict(target):
     - target (str): The target system.
 
     Returns:
-    - dict: The equivalent schema dictionary in the target system.
-    """
-    if target == "str":
-        return {
-            "int": "int",
-            "float": "float",
-            "str": "str",
-            "bool": "bool",
-            "timestamp": "timestamp",
-            "date": "date",
-            "time": "time",
-            "datetime": "datetime",
-            "bytes": "bytes",
-            "array": "array",
-            "struct": "struct",
-            "null": "null",
-        }
-    elif target == "python":
-        return {
-            "int": int,
-            "float": float,
-            "str": str,
-            "bool": bool,
-            "timestamp": datetime,
-            "date": date,
-            "time": time,
-            "datetime": datetime,
-            "bytes": bytes,
-            "array": list,
-            "struct": dict,
-            "null": type(None),
-        }
-    elif target == "bigquery":
-        return {
-            "null": "BOOLEAN",
-            "int": "INTEGER",
-            "float": "FLOAT",
-            "str": "STRING",
-            "bool": "BOOLEAN",
-            "timestamp": "TIMESTAMP",
-            "date": "DATE",
-            "time": "TIME",
-            "datetime": "DATETIME",
-            "bytes": "BYTES",
-            "array": "ARRAY",
-            "struct": "STRUCT",
-        }
-    elif target == "pandas":
-        return {
-            "int": "Int64",
-            "float": "Float64",
-            "str": "string",
-            "bool": "boolean",
-            "timestamp": "datetime64[ns]",
-            "date": "datetime64[ns]",
-            "time": "datetime64[ns]",
-            "datetime": "datetime64[ns]",
-            "bytes": "bytes",
-            "array": "list",
-            "struct": "struct",
-            "null": "object",
-        }
-    elif target == "pyarrow":
-        return {
-            "int": "int64",
-            "float": "double",
-            "str": "string",
-            "bool": "bool",
-            "timestamp": "timestamp[ns]",
-            "date": "date32",
-            "time": "time64[ns]",
-            "datetime": "timestamp[ns]",
-            "bytes": "binary",
-            "array": "list",
-            "struct": "struct",
-            "null": "null",
-        }
-    else:
-        raise ValueError(f"Unsupported target system: {target}")
+    - Mapping: The (read-only) equivalent schema dictionary in the target system.
+    """
+    try:
+        return SCHEMA_DICTS[target]
+    except KeyError:
+        raise ValueError(f"Unsupported target system: {target}") from None
+
+
+def get_reversed_schema_dict(target):
+    """
+    Get the schema dictionary mapping types in the target system back to "str" types.
+
+    Args:
+    - target (str): The target system.
+
+    Returns:
+    - Mapping: The (read-only) reversed schema dictionary.
+    """
+    try:
+        return REVERSED_SCHEMA_DICTS[target]
+    except KeyError:
+        raise ValueError(f"Unsupported target system: {target}") from None
 
 
 ALL_SUPPORTED_SCHEMA_TYPES = ["bigquery", "str", "python", "pandas", "pyarrow"]
@@ -110,16 +146,16 @@ def compute_type_matches(schema: list, target_schema: list):
 
     Args:
     - schema (list): The input schema values.
-    - target_schema (list): The target schema values against which to compare.
+    - target_schema (set|list): The target schema values against which to compare.
 
     Returns:
     - int: The number of type matches.
     """
-    type_matches = 0
-    for value in schema:
-        if value in target_schema:
-            type_matches += 1
-    return type_matches
+    if not isinstance(target_schema, (set, frozenset)):
+        target_schema = set(target_schema)
+    # Counted with C-level builtins. Not a set intersection: repeated types (e.g. two
+    # "int" columns) must each count as a match
+    return sum(map(target_schema.__contains__, schema))
 
 
 def get_matching_schema_type(schema):
@@ -136,27 +172,30 @@ def get_matching_schema_type(schema):
         schema_values = get_dict_items(schema, "value")
     else:
         schema_values = schema
-    type_matches = {}
+    # Score every target in one pass, tracking the total, the best target (the first
+    # one on ties) and how many targets match all columns
+    n_schema = len(schema)
+    total, n_full_matches = 0, 0
+    matching_type, best_matches = None, -1
     for target in ALL_SUPPORTED_SCHEMA_TYPES:
-        target_schema = get_equivalent_schema_dict(target)
-        target_values = get_dict_items(target_schema, "value")
-        type_matches[target] = compute_type_matches(schema_values, target_values)
-
-    matching_values = type_matches.values()
-    matching_type = max(type_matches, key=type_matches.get)
-    if sum(matching_values) == 0:
+        n_matches = compute_type_matches(schema_values, SCHEMA_VALUE_SETS[target])
+        total += n_matches
+        n_full_matches += n_matches == n_schema
+        if n_matches > best_matches:
+            matching_type, best_matches = target, n_matches
+    if total == 0:
         log("Schema - No matching schema type found.")
         return None
-    elif sum([x == len(schema) for x in matching_values]) > 1:
+    if n_full_matches > 1:
         log("Schema - Multiple matching schema types found.")
         return None
-    matching_type = max(type_matches, key=type_matches.get)
-    if type_matches[matching_type] != len(schema_values):
+    if best_matches != len(schema_values):
         log("Schema - Not all schema types matched.")
         return None
     return matching_type
 
 
+@functools.lru_cache(maxsize=256)
 def get_equivalent_schema_type(schema_type, target="bigquery", direction="forward"):
     """
     Get the equivalent schema type in the target system.
@@ -169,13 +208,42 @@ def get_equivalent_schema_type(schema_type, target="bigquery", direction="forwar
     Returns:
     - str: The equivalent schema type in the target system.
     """
-    schema_dict = get_equivalent_schema_dict(target, direction)
     if direction == "reverse":
-        schema_dict = reverse_dict(schema_dict)
-    if schema_type in schema_dict:
-        return schema_dict[schema_type]
+        schema_dict = get_reversed_schema_dict(target)
     else:
-        raise ValueError(f"Unsupported schema type: {schema_type}")
+        schema_dict = get_equivalent_schema_dict(target)
+    try:
+        return schema_dict[schema_type]
+    except KeyError:
+        raise ValueError(f"Unsupported schema type: {schema_type}") from None
+
+
+@functools.lru_cache(maxsize=64)
+def _direct_map(origin, target):
+    """
+    Build the direct mapping from types in the origin system to types in the target
+    system, once per (origin, target) pair.
+
+    Args:
+    - origin (str): The origin system.
+    - target (str): The target system.
+
+    Returns:
+    - Mapping: The (read-only) mapping from origin types to target types.
+    """
+    return _compose(get_reversed_schema_dict(origin), get_equivalent_schema_dict(target))
+
+
+def _compose(schema_from, schema_to):
+    """
+    Compose origin type -> str type and str type -> target type into one mapping.
+    """
+    mapping = {
+        type_from: schema_to[type_str]
+        for type_from, type_str in schema_from.items()
+        if type_str in schema_to
+    }
+    return types.MappingProxyType(mapping)
 
 
 def get_equivalent_schema(
@@ -196,23 +264,71 @@ def get_equivalent_schema(
         origin = "str"
     # In a parallel universe where Python is a functional language...
     # origin -> target = (str -> origin) -> target = (origin <- str) -> target
+    if schema_from is None and schema_to is None:
+        direct = _direct_map(origin, target)
+    else:
+        if schema_from is None:
+            schema_from = get_reversed_schema_dict(origin)
+        if schema_to is None:
+            schema_to = get_equivalent_schema_dict(target)
+        direct = _compose(schema_from, schema_to)
+    return _map_schema(schema, direct.__getitem__)
+
+
+def _map_schema(schema, lookup):
+    """
+    Map each (possibly nested) column type of a schema with `lookup`.
+    """
     equivalent_schema = {}
-    if schema_from is None:
-        schema_from = reverse_dict(get_equivalent_schema_dict(origin))
-    if schema_to is None:
-        schema_to = get_equivalent_schema_dict(target)
-    for col, col_type in schema.items():
-        if isinstance(col_type, dict):
-            type_to = get_equivalent_schema(
-                col_type, origin, target, schema_from, schema_to
-            )
-        else:
-            type_from = schema_from[col_type]
-            type_to = schema_to[type_from]
-        equivalent_schema[col] = type_to
+    # Walk nested structs with a stack of (input, output) dicts instead of recursing
+    stack = [(schema, equivalent_schema)]
+    while stack:
+        schema, output = stack.pop()
+        for col, col_type in schema.items():
+            if isinstance(col_type, dict):
+                output[col] = nested = {}
+                stack.append((col_type, nested))
+            else:
+                output[col] = lookup(col_type)
     return equivalent_schema
 
 
+# Python and str types of the Pandas dtype strings, keyed by target system. Shared by
+# every call, so they are built once at import and kept read-only.
+DTYPE_STR_TYPES = types.MappingProxyType(
+    {
+        "python": types.MappingProxyType(
+            {
+                "int": int,
+                "int64": int,
+                "float": float,
+                "float64": float,
+                "str": str,
+                "bool": bool,
+                "object": str,
+                "datetime64[ns]": datetime,
+            }
+        ),
+        "str": types.MappingProxyType(
+            {
+                "int": "int",
+                "int64": "int",
+                "Int64": "int",
+                "float": "float",
+                "float64": "float",
+                "Float64": "float",
+                "str": "str",
+                "string": "str",
+                "bool": "bool",
+                "boolean": "bool",
+                "object": "str",
+                "datetime64[ns]": "datetime",
+            }
+        ),
+    }
+)
+
+
 def dtype_str_to_type(dtype_str, target="str"):
     """
     Map a string representation of a Pandas dtype to its corresponding Python or str type
@@ -224,35 +340,57 @@ def dtype_str_to_type(dtype_str, target="str"):
     Returns:
     - type: The Python type corresponding to the dtype string.
     """
-    if target == "python":
-        target_types = {
-            "int": int,
-            "int64": int,
-            "float": float,
-            "float64": float,
-            "str": str,
-            "bool": bool,
-            "object": str,
-            "datetime64[ns]": datetime,
-        }
-    elif target == "str":
-        target_types = {
-            "int": "int",
-            "int64": "int",
-            "Int64": "int",
-            "float": "float",
-            "float64": "float",
-            "Float64": "float",
-            "str": "str",
-            "string": "str",
-            "bool": "bool",
-            "boolean": "bool",
-            "object": "str",
-            "datetime64[ns]": "datetime",
-        }
+    try:
+        target_types = DTYPE_STR_TYPES[target]
+    except KeyError:
+        raise ValueError(f"Unsupported target system: {target}") from None
     return target_types.get(dtype_str, dtype_str)
 
 
+# str types of the fixed dtypes (e.g. int64, Int64, string), keyed on the dtype itself
+# so a column's type can be looked up without formatting its dtype each time. Only
+# dtypes in DTYPE_STR_TYPES are cached, as there is an unbounded number of the others
+# (e.g. one CategoricalDtype per set of categories).
+_DTYPE_TO_STR = {}
+
+
+def _dtype_to_str(dtype):
+    """
+    Map a Pandas dtype object to its str type, caching the result for fixed dtypes.
+
+    Args:
+    - dtype (dtype): The Pandas or numpy dtype.
+
+    Returns:
+    - str: The str type corresponding to the dtype.
+    """
+    try:
+        return _DTYPE_TO_STR[dtype]
+    except (KeyError, TypeError):
+        pass
+    dtype_str = str(dtype)
+    output = dtype_str_to_type(dtype_str)
+    if dtype_str in DTYPE_STR_TYPES["str"]:
+        _DTYPE_TO_STR[dtype] = output
+    return output
+
+
+@functools.lru_cache(maxsize=None)
+def _bigquery():
+    """
+    Import `google.cloud.bigquery` on first use.
+    """
+    return try_import("google.cloud.bigquery", "Schema")
+
+
+@functools.lru_cache(maxsize=None)
+def _pyarrow():
+    """
+    Import `pyarrow` on first use.
+    """
+    return try_import("pyarrow", "Schema")
+
+
 def dict_to_bigquery_fields(schema_dict):
     """
     Convert a dictionary to a BigQuery schema.
@@ -263,20 +401,18 @@ def dict_to_bigquery_fields(schema_dict):
     Returns:
     - list[bigquery.SchemaField]: The BigQuery schema.
     """
-    from google.cloud import bigquery
+    SchemaField = _bigquery().SchemaField
 
-    schema = []
-    for col, col_type in schema_dict.items():
-        if isinstance(col_type, dict):
-            schema.append(
-                bigquery.SchemaField(
-                    col, "RECORD", fields=dict_to_bigquery_fields(col_type)
-                )
-            )
-        else:
-            schema.append(bigquery.SchemaField(col, col_type))
+    def to_fields(fields_dict):
+        fields = []
+        for col, col_type in fields_dict.items():
+            if isinstance(col_type, dict):
+                fields.append(SchemaField(col, "RECORD", fields=to_fields(col_type)))
+            else:
+                fields.append(SchemaField(col, col_type))
+        return fields
 
-    return schema
+    return to_fields(schema_dict)
 
 
 def bigquery_fields_to_dict(schema):
@@ -355,20 +491,27 @@ def dict_to_pyarrow_fields(schema_dict):
     Returns:
     - pyarrow.Schema: The PyArrow schema.
     """
-    import pyarrow as pa
-
-    fields = []
+    pa = _pyarrow()
+    # Bound once for the whole (possibly nested) conversion
+    field, struct, list_ = pa.field, pa.struct, pa.list_
+
+    def to_fields(fields_dict):
+        if not isinstance(fields_dict, dict):
+            return getattr(pa, fields_dict)()
+        fields = []
+        for col, col_type in fields_dict.items():
+            if isinstance(col_type, dict):
+                fields.append(field(col, struct(to_fields(col_type))))
+            elif isinstance(col_type, list):
+                fields.append(field(col, list_(to_fields(col_type[0]))))
+            else:
+                fields.append(field(col, col_type))
+        return fields
+
+    fields = to_fields(schema_dict)
     if not isinstance(schema_dict, dict):
-        return getattr(pa, schema_dict)()
-    for col, col_type in schema_dict.items():
-        if isinstance(col_type, dict):
-            fields.append(pa.field(col, pa.struct(dict_to_pyarrow_fields(col_type))))
-        elif isinstance(col_type, list):
-            fields.append(pa.field(col, pa.list_(dict_to_pyarrow_fields(col_type[0]))))
-        else:
-            fields.append(pa.field(col, col_type))
-    schema = pa.schema(fields)
-    return schema
+        return fields
+    return pa.schema(fields)
 
 
 def pyarrow_fields_dict_to_dict(schema_fields_dict):
@@ -447,13 +590,21 @@ def type_to_str(schema_dict):
         return []
     if not isinstance(schema_dict, dict):
         return schema_dict.__name__
-    for col, col_type in schema_dict.items():
-        if isinstance(col_type, dict):
-            schema_str[col] = {str(k): type_to_str(v) for k, v in col_type.items()}
-        elif isinstance(col_type, list):
-            schema_str[col] = [type_to_str(v) for v in col_type]
-        else:
-            schema_str[col] = col_type.__name__
+    # Walk nested structs with a stack of (input, output) dicts instead of recursing.
+    # Keys of nested structs are converted to str.
+    stack = [(schema_dict, schema_str, False)]
+    while stack:
+        schema_dict, output, str_keys = stack.pop()
+        for col, col_type in schema_dict.items():
+            if str_keys:
+                col = str(col)
+            if isinstance(col_type, dict):
+                output[col] = nested = {}
+                stack.append((col_type, nested, True))
+            elif isinstance(col_type, list):
+                output[col] = [type_to_str(v) for v in col_type]
+            else:
+                output[col] = col_type.__name__
     return schema_str
 
 
@@ -461,41 +612,100 @@ def ensure_types(df, types_dict):
     """
     Ensure the types of the columns of the df.
     """
-    for c, c_type in types_dict.items():
-        if c in df.columns:
-            df[c] = df[c].astype(c_type)
-    return df
+    # One astype call casts all the columns together, rather than one copy per column
+    types_dict = {c: c_type for c, c_type in types_dict.items() if c in df.columns}
+    if not types_dict:
+        return df
+    return df.astype(types_dict)
+
+
+def _astype_series(series, schema):
+    return series.astype(schema)
+
+
+def _apply_series(series, schema):
+    # Plain functions and lambdas are applied element-wise
+    return series.apply(schema)
+
+
+def _map_series(series, schema):
+    from pandas.api.types import is_extension_array_dtype
+
+    if not schema:
+        return series
+    if is_extension_array_dtype(series.dtype):
+        # e.g. categoricals, which map their categories and keep their dtype this way
+        return series.map(lambda x: schema.get(x, x))
+    # Mapped in pandas rather than row by row. The object-dtype mapping keeps the
+    # mapped values as they are (e.g. None stays None and ints don't become floats),
+    # values missing from the dict are kept, and the dtype is then inferred again
+    mapping = type(series)(list(schema.values()), index=list(schema), dtype=object)
+    mapped = series.map(mapping).where(series.isin(mapping.index), series)
+    return mapped.infer_objects()
+
+
+# Handlers for the common schema types, looked up on the exact type of the schema.
+# Anything else (subclasses, callable objects) goes through the isinstance checks.
+_SERIES_HANDLERS = {
+    type: _astype_series,
+    str: _astype_series,
+    types.FunctionType: _apply_series,
+    dict: _map_series,
+}
 
 
 def enforce_schema_on_series(series, schema):
     """
     Enforce a schema on a pandas Series.
     """
+    handler = _SERIES_HANDLERS.get(type(schema))
+    if handler is not None:
+        return handler(series, schema)
     if isinstance(schema, (type, str)):
-        return series.astype(schema)
-    elif isinstance(schema, type(lambda x: x)):
-        return series.apply(schema)
+        return _astype_series(series, schema)
+    elif isinstance(schema, types.FunctionType):
+        return _apply_series(series, schema)
     elif callable(schema):
         return schema(series)
     elif isinstance(schema, dict):
-        return series.map(lambda x: schema.get(x, x))
+        return _map_series(series, schema)
     else:
         raise TypeError("Unsupported schema type.")
 
 
+def _apply_list(lst, schema):
+    return [schema(x) for x in lst]
+
+
+def _map_list(lst, schema):
+    return list(map(schema.get, lst, lst))
+
+
+def _convert_list(lst, schema):
+    return _apply_list(lst, dtype_str_to_type(schema, target="python"))
+
+
+_LIST_HANDLERS = {
+    type: _apply_list,
+    types.FunctionType: _apply_list,
+    dict: _map_list,
+    str: _convert_list,
+}
+
+
 def enforce_schema_on_list(lst, schema):
     """
     Enforce a schema on a list.
     """
+    handler = _LIST_HANDLERS.get(type(schema))
+    if handler is not None:
+        return handler(lst, schema)
     if callable(schema):
-        return [schema(x) for x in lst]
+        return _apply_list(lst, schema)
     elif isinstance(schema, dict):
-        return [schema.get(x, x) for x in lst]
-    elif isinstance(schema, type):
-        return [schema(x) for x in lst]
+        return _map_list(lst, schema)
     elif isinstance(schema, str):
-        schema = dtype_str_to_type(schema, target="python")
-        return [schema(x) for x in lst]
+        return _convert_list(lst, schema)
     else:
         raise TypeError("Unsupported schema type.")
 
@@ -511,26 +721,27 @@ def enforce_one_schema(data, col_schema):
     Returns:
     - Series|List: The data with the schema enforced.
     """
-
-    # Helper function to ensure data is a list
-    def force_list(data):
-        return data if isinstance(data, list) else [data]
-
-    if isinstance(col_schema, list):
-        # Attempt to enforce each schema in the list until one succeeds
-        for schema in col_schema:
-            try:
-                return enforce_one_schema(data, schema)
-            except Exception:
-                continue
-        else:
-            raise ValueError(f"Could not enforce schema {col_schema} on {data}")
-    else:
+    if not isinstance(col_schema, list):
         if is_series(data):
             return enforce_schema_on_series(data, col_schema)
-        else:
-            data = force_list(data)
-            return enforce_schema_on_list(data, col_schema)
+        return enforce_schema_on_list(force_list(data), col_schema)
+    # Attempt to enforce each schema in the list until one succeeds
+    for schema in col_schema:
+        try:
+            return enforce_one_schema(data, schema)
+        except Exception:
+            continue
+    raise ValueError(f"Could not enforce schema {col_schema} on {data}")
+
+
+def _has_dtype(series, dtype):
+    """
+    Check whether a Series already has the given dtype, e.g. "int64" or `int`.
+    """
+    try:
+        return bool(series.dtype == dtype)
+    except TypeError:
+        return False
 
 
 def enforce_schema(df, schema={}, dtypes={}, errors="raise"):
@@ -549,9 +760,24 @@ def enforce_schema(df, schema={}, dtypes={}, errors="raise"):
     schema = {**dtypes, **schema}  # schema takes precedence over dtypes
     if schema == {}:
         return df
-    for col, col_schema in schema.items():
+    for col in schema:
         if col not in df:
             df[col] = None
+    if is_dataframe(df):
+        # Plain dtypes are cast together in a single astype call; callables, mappings
+        # and lists of fallbacks are then applied column by column
+        castable = {c: s for c, s in schema.items() if isinstance(s, (type, str))}
+        # Columns that already have the target dtype are left as they are
+        to_cast = {c: s for c, s in castable.items() if not _has_dtype(df[c], s)}
+        done = castable.keys() - to_cast.keys()
+        try:
+            if to_cast:
+                df = df.astype(to_cast)
+            done = castable.keys()
+        except Exception:
+            pass  # Cast column by column below, to report the failing column
+        schema = {c: s for c, s in schema.items() if c not in done}
+    for col, col_schema in schema.items():
         try:
             df[col] = enforce_one_schema(df[col], col_schema)
         except Exception as e:
@@ -574,8 +800,7 @@ def infer_schema(data, schema_type="python"):
     schema = {}
     if is_dataframe(data):
         data = data.convert_dtypes(convert_integer=False)
-        for col, dtype in data.dtypes.items():
-            schema[col] = dtype_str_to_type(str(dtype))
+        schema = {col: _dtype_to_str(dtype) for col, dtype in data.dtypes.items()}
     elif isinstance(data, dict):
         for col, values in data.items():
             if isinstance(values, dict):
@@ -598,6 +823,16 @@ def infer_schema(data, schema_type="python"):
     return schema
 
 
+def _copy_output(output_schema):
+    """
+    Shallow copy a cached schema if it is a dict or list, so that callers modifying it
+    do not change the cached one.
+    """
+    if isinstance(output_schema, (dict, list)):
+        return output_schema.copy()
+    return output_schema
+
+
 class Schema:
     """
     A class for for bridging the gap between different schema representations of similar data.
@@ -617,6 +852,8 @@ class Schema:
     - `Schema({"a": "int", "b": "str"}, schema_type="str").str()` -> String schema
     """
 
+    __slots__ = ("is_data", "input_schema", "_schema", "_schema_type", "_converted")
+
     def __init__(self, input: dict = {}, schema_type: str = None, is_data=False):
         self.is_data = is_data if not is_dataframe(input) else True
         if self.is_data and isinstance(input, list) and isinstance(input[0], dict):
@@ -639,6 +876,26 @@ class Schema:
     def __repr__(self):
         return f"Schema({self.schema})"
 
+    @property
+    def schema(self):
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema):
+        self._schema = schema
+        # Outputs of the converters below, keyed by target system. They depend on the
+        # schema and its type, so they are dropped whenever either is set
+        self._converted = {}
+
+    @property
+    def schema_type(self):
+        return self._schema_type
+
+    @schema_type.setter
+    def schema_type(self, schema_type):
+        self._schema_type = schema_type
+        self._converted = {}
+
     def convert_schema_to_str(self):
         """
         Convert the schema to a Python dictionary.
@@ -688,37 +945,52 @@ class Schema:
         self.schema_type = "str"
         return self
 
+    def _convert(self, target, to_output=None):
+        """
+        Convert the schema to the target system, once per target.
+
+        Args:
+        - target (str): The target system.
+        - to_output (callable): Builds the output from the equivalent schema dict.
+
+        Returns:
+        - The converted schema. Dicts and lists are copies, so callers can modify them.
+        """
+        output_schema = self._converted.get(target)
+        if output_schema is None:
+            output_schema = get_equivalent_schema(self.schema, self.schema_type, target)
+            if to_output is not None:
+                output_schema = to_output(output_schema)
+            self._converted[target] = output_schema
+        return _copy_output(output_schema)
+
     def bigquery(self) -> dict:
         if self.schema_type == "bigquery":
             return self.schema
-        output_schema = get_equivalent_schema(self.schema, self.schema_type, "bigquery")
-        output_schema = dict_to_bigquery_fields(output_schema)
-        return output_schema
+        return self._convert("bigquery", dict_to_bigquery_fields)
 
     def python(self) -> dict:
         if self.schema_type == "python":
             return self.schema
-        output_schema = get_equivalent_schema(self.schema, self.schema_type, "python")
-        return output_schema
+        return self._convert("python")
 
     def pandas(self) -> dict:
         if self.schema_type == "pandas":
             return self.schema
-        output_schema = get_equivalent_schema(self.schema, self.schema_type, "pandas")
-        return output_schema
+        return self._convert("pandas")
 
     def pyarrow(self) -> dict:
         if self.schema_type == "pyarrow":
             return self.schema
-        output_schema = get_equivalent_schema(self.schema, self.schema_type, "pyarrow")
-        output_schema = dict_to_pyarrow_fields(output_schema)
-        return output_schema
+        return self._convert("pyarrow", dict_to_pyarrow_fields)
 
     def str(self) -> str:
         if self.schema_type == "str":
             return self.schema
-        output_schema = type_to_str(self.schema)
-        return output_schema
+        output_schema = self._converted.get("str")
+        if output_schema is None:
+            output_schema = self._converted["str"] = type_to_str(self.schema)
+        return _copy_output(output_schema)
 
 
 if __name__ == "__main__":
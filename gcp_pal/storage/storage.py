@@ -8,6 +8,25 @@ class Storage:
     Class for operating Google Cloud Storage
     """
 
+    __slots__ = (
+        "project",
+        "location",
+        "fs_prefix",
+        "path",
+        "bucket_name",
+        "base_path",
+        "file_name",
+        "name",
+        "bucket_path",
+        "ref_type",
+        "is_file",
+        "is_bucket",
+        "is_project",
+        "gcsfs",
+        "GCSFileSystem",
+        "fs",
+    )
+
     def __init__(self, path=None, bucket_name=None, project=None, location=None):
         self.project = project or get_default_arg("project")
         self.location = location or get_default_arg("location")
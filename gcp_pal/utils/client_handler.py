@@ -1,9 +1,17 @@
+import threading
+
+
 class ClientHandler:
     """
     A class for handling clients. If the client is already created, return it. Otherwise, create it.
     """
 
     _clients = {}
+    # Guards client creation, so concurrent callers don't each build their own client.
+    # Each client key gets its own lock, so slow construction of one client (OAuth,
+    # channel setup) doesn't hold up callers waiting on a different one.
+    _clients_lock = threading.Lock()
+    _key_locks = {}
 
     def __init__(self, client_initializer):
         """
@@ -33,11 +41,17 @@ class ClientHandler:
         """
         input_key = frozenset(kwargs.items())
         client_key = (self.initializer_name, input_key)
-        if client_key in ClientHandler._clients and not force_refresh:
-            client = ClientHandler._clients[client_key]
-        else:
-            client = self.client_initializer(**kwargs)
-            ClientHandler._clients[client_key] = client
+        if not force_refresh:
+            client = ClientHandler._clients.get(client_key)
+            if client is not None:
+                return client
+        with ClientHandler._clients_lock:
+            key_lock = ClientHandler._key_locks.setdefault(client_key, threading.Lock())
+        with key_lock:
+            client = ClientHandler._clients.get(client_key)
+            if client is None or force_refresh:
+                client = self.client_initializer(**kwargs)
+                ClientHandler._clients[client_key] = client
         return client
 
 
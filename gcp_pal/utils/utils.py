@@ -1,4 +1,6 @@
 import os
+import re
+import sys
 import json
 import logging
 import importlib
@@ -52,13 +54,14 @@ def try_import(module_name, origin_module=None, errors="raise"):
         return None
 
 
-err = try_import("google.cloud.logging", "logging", errors="ignore")
-try_import("google.cloud.logging.handlers.transports", "logging", errors="ignore")
-if err is not None:
-    from google.cloud import logging as gcp_logging
-    from google.cloud.logging.handlers.transports import SyncTransport
+if os.getenv("PLATFORM", "") in ["GCP", "local"]:
+    # Only pay for importing google.cloud.logging when Cloud Logging is actually used
+    err = try_import("google.cloud.logging", "logging", errors="ignore")
+    try_import("google.cloud.logging.handlers.transports", "logging", errors="ignore")
+    if err is not None:
+        from google.cloud import logging as gcp_logging
+        from google.cloud.logging.handlers.transports import SyncTransport
 
-    if os.getenv("PLATFORM", "") in ["GCP", "local"]:
         client = gcp_logging.Client()
         handler = gcp_logging.handlers.CloudLoggingHandler(
             client, name="gcp_pal", transport=SyncTransport
@@ -69,6 +72,8 @@ if err is not None:
 def log(*args, **kwargs):
     """
     Function for logging to Google Cloud Logs. Logs a message as usual, and logs a dictionary of data as jsonPayload.
+    If the first argument is a string with %-placeholders, the remaining arguments are formatted into it
+    (as with `logging`), so the message is only built when it is actually logged.
 
     Args:
         *args (list): list of elements to "print" to google cloud logs.
@@ -80,7 +85,13 @@ def log(*args, **kwargs):
     >>> log("Hello, world!", {"a": 1, "b": 2})
     message: "Hello, world!"
     payload: {"a": 1, "b": 2}
+    >>> log("Hello, %s!", "world")
+    message: "Hello, world!"
     """
+    on_gcp = os.getenv("PLATFORM", "Local") in ["GCP"]
+    if on_gcp and not logging.getLogger().isEnabledFor(logging.INFO):
+        # Nothing would be emitted, so don't build the message
+        return
 
     # Use these environment variables as payload to log to Google Cloud Logs
     env_keys = ["PLATFORM"]
@@ -91,15 +102,109 @@ def log(*args, **kwargs):
     for arg in args:
         if isinstance(arg, dict):
             log_data.update(arg)
-        log_data["message"] = " ".join([str(a) for a in args])
+    log_data["message"] = _format_log_message(args)
 
-    if os.getenv("PLATFORM", "Local") in ["GCP"]:
+    if on_gcp:
         logging.info(log_data)
     else:
         # If running locally, use a normal print
         print(log_data["message"], **kwargs)
 
 
+def _format_log_message(args):
+    """
+    Build the log message: %-format the first argument with the rest, or join all arguments with spaces.
+    """
+    if len(args) > 1 and isinstance(args[0], str) and "%" in args[0]:
+        # Only treat it as a format string if every remaining argument has a placeholder,
+        # so that e.g. log("50% done", x) is still joined
+        placeholders = re.findall(r"%[sdrf]", args[0].replace("%%", ""))
+        if len(placeholders) == len(args) - 1:
+            try:
+                return args[0] % args[1:]
+            except (TypeError, ValueError):
+                pass
+    return " ".join([str(a) for a in args])
+
+
+def wait_all(operations, timeout=600, max_workers=32):
+    """
+    Wait for several long-running operations (e.g. deployments started with `wait_to_complete=False`) concurrently.
+
+    Args:
+    - operations (list): The operations to wait for.
+    - timeout (int): The timeout for each operation in seconds.
+    - max_workers (int): The maximum number of operations to wait on at the same time.
+
+    Returns:
+    - list: The results of the operations, in the same order.
+
+    Examples:
+    >>> ops = [CloudFunctions(n).deploy(p, "main", wait_to_complete=False) for n, p in functions]
+    >>> wait_all(ops)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    operations = list(operations)
+    if not operations:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(operations))) as executor:
+        return list(executor.map(lambda op: op.result(timeout=timeout), operations))
+
+
+async def await_operation(operation, initial_delay=1.0, max_delay=30.0, timeout=600):
+    """
+    Wait for a long-running operation without blocking the event loop, polling with
+    exponential backoff. Many deployments can then be awaited together on one thread.
+
+    Args:
+    - operation (google.api_core.operation.Operation): The operation to wait for.
+    - initial_delay (float): The delay before the first poll in seconds.
+    - max_delay (float): The maximum delay between polls in seconds.
+    - timeout (int): The maximum time to wait in seconds.
+
+    Returns:
+    - The result of the operation.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = initial_delay
+    # `done()` refreshes the operation with a short RPC, so run it off the event loop
+    while not await asyncio.to_thread(operation.done):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Operation did not complete within {timeout} seconds.")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+    return operation.result()
+
+
+def prefetch_pages(pages):
+    """
+    Iterate over the pages of a paged list response, fetching the next page in the background
+    while the current one is being consumed.
+
+    Args:
+    - pages (iterator): The pages, e.g. `client.list_services(parent=parent).pages`.
+
+    Returns:
+    - generator: The pages, in order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pages = iter(pages)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, pages, None)
+        while True:
+            page = future.result()
+            if page is None:
+                return
+            future = executor.submit(next, pages, None)
+            yield page
+
+
 def force_list(x):
     """
     Force x to be a list
@@ -177,7 +282,11 @@ def is_series(obj):
     Returns:
     - bool: Whether the object is a pandas Series.
     """
-    return type(obj).__name__ == "Series"
+    if "pandas" not in sys.modules:
+        # If pandas was never imported, nothing can be a pandas object
+        return False
+    obj_type = type(obj)
+    return obj_type.__name__ == "Series" and obj_type.__module__.startswith("pandas")
 
 
 def is_dataframe(obj):
@@ -188,9 +297,14 @@ def is_dataframe(obj):
     - obj: The object to check.
 
     Returns:
-    - bool: Whether the object is a pandas Series.
+    - bool: Whether the object is a pandas DataFrame.
     """
-    return type(obj).__name__ == "DataFrame"
+    if "pandas" not in sys.modules:
+        return False
+    obj_type = type(obj)
+    return obj_type.__name__ == "DataFrame" and obj_type.__module__.startswith(
+        "pandas"
+    )
 
 
 def is_numpy_array(obj):
@@ -317,6 +431,10 @@ def orient_dict(d, orientation=""):
     return output
 
 
+# (credentials, project) from google.auth.default(), keyed by project
+_AUTH_DEFAULTS = {}
+
+
 def get_auth_default(allow_none=False, errors="raise"):
     """
     Get the default project from google.auth.default() and store it in an environment variable.
@@ -327,20 +445,30 @@ def get_auth_default(allow_none=False, errors="raise"):
     Returns:
     - str: The default project.
     """
+    project = os.getenv("_GOOGLE_AUTH_DEFAULT_PROJECT", None)
+    if project is not None and project in _AUTH_DEFAULTS:
+        # Resolved earlier in this process
+        return _AUTH_DEFAULTS[project]
+
     try_import("google.auth", "get_default_project")
     import google.auth as google_auth
 
-    project = os.getenv("_GOOGLE_AUTH_DEFAULT_PROJECT", None)
     credentials = os.getenv("_GOOGLE_AUTH_DEFAULT_CREDENTIALS", None)
     if project is not None:
         try:
             credentials = google_auth.credentials.Credentials.from_json(credentials)
         except AttributeError:
             pass
+        _AUTH_DEFAULTS[project] = (credentials, project)
         return credentials, project
 
-    credentials, project = google_auth.default()
+    if None in _AUTH_DEFAULTS:
+        # An earlier lookup found credentials but no project; don't probe again
+        credentials, project = _AUTH_DEFAULTS[None]
+    else:
+        credentials, project = google_auth.default()
     if project is None:
+        _AUTH_DEFAULTS[None] = (credentials, project)
         err = "No default project found. Please set the PROJECT environment variable."
         if errors == "raise":
             raise ValueError(err)
@@ -353,36 +481,74 @@ def get_auth_default(allow_none=False, errors="raise"):
         os.environ["_GOOGLE_AUTH_DEFAULT_CREDENTIALS"] = credentials.to_json()
     except AttributeError:
         pass
+    _AUTH_DEFAULTS[project] = (credentials, project)
     print(f"Obtained default project: {project}")
     return credentials, project
 
 
-def zip_directory(directory, output_file=None, omit_root=True):
+def _write_zip(target, directory, compresslevel=1, omit_root=True, skip=None):
     """
-    Zip a directory.
+    Write the contents of a directory into a deflated zip archive.
 
     Args:
+    - target (str|file): The output file path or file object.
     - directory (str): The directory to zip.
-    - output_file (str): The output file.
+    - compresslevel (int): The deflate compression level. Defaults to 1, favouring speed.
+    - omit_root (bool): Whether to store paths relative to `directory`.
+    - skip (str): A file name to leave out of the archive.
     """
-    from zipfile import ZipFile
+    from zipfile import ZipFile, ZIP_DEFLATED
 
-    if not output_file:
-        output_file = f"{directory}.zip"
-    with ZipFile(output_file, "w") as z:
+    with ZipFile(target, "w", ZIP_DEFLATED, compresslevel=compresslevel) as z:
         for root, dirs, files in os.walk(directory):
             for file in files:
-                if file == os.path.basename(output_file):
-                    # Want to omit the zip file itself to avoid infinite recursion
+                if file == skip:
                     continue
+                file_path = os.path.join(root, file)
                 if omit_root:
-                    out_name = os.path.relpath(os.path.join(root, file), directory)
+                    out_name = os.path.relpath(file_path, directory)
                 else:
-                    out_name = os.path.join(root, file)
-                z.write(os.path.join(root, file), out_name)
+                    out_name = file_path
+                z.write(file_path, out_name)
+
+
+def zip_directory(directory, output_file=None, omit_root=True, compresslevel=1):
+    """
+    Zip a directory.
+
+    Args:
+    - directory (str): The directory to zip.
+    - output_file (str): The output file.
+    - omit_root (bool): Whether to store paths relative to `directory`.
+    - compresslevel (int): The deflate compression level. Defaults to 1, favouring speed.
+    """
+    if not output_file:
+        output_file = f"{directory}.zip"
+    # Want to omit the zip file itself to avoid infinite recursion
+    skip = os.path.basename(output_file)
+    _write_zip(output_file, directory, compresslevel, omit_root, skip=skip)
     return output_file
 
 
+def zip_directory_stream(directory, compresslevel=1):
+    """
+    Zip a directory into an in-memory buffer, without touching the disk.
+
+    Args:
+    - directory (str): The directory to zip.
+    - compresslevel (int): The deflate compression level. Defaults to 1, favouring speed.
+
+    Returns:
+    - (BytesIO): The zip archive, rewound to the start.
+    """
+    from io import BytesIO
+
+    buffer = BytesIO()
+    _write_zip(buffer, directory, compresslevel)
+    buffer.seek(0)
+    return buffer
+
+
 def get_all_kwargs(locals_kwargs):
     """
     Get all kwargs from a locals() dictionary.
@@ -434,13 +600,12 @@ def get_default_arg(arg_name):
     """
     from gcp_pal.config import DEFAULT_ARGS
 
-    arg_dict = {
-        "project": os.environ.get("GCP_PAL_PROJECT") or get_auth_default()[1],
-        "location": os.environ.get("GCP_PAL_LOCATION")
-        or DEFAULT_ARGS.get("location", None),
-    }
-    output = arg_dict.get(arg_name, None)
-    return output
+    # Only resolve the requested argument: the project lookup may call google.auth.default()
+    if arg_name == "project":
+        return os.environ.get("GCP_PAL_PROJECT") or get_auth_default()[1]
+    if arg_name == "location":
+        return os.environ.get("GCP_PAL_LOCATION") or DEFAULT_ARGS.get("location", None)
+    return None
 
 
 class JSON:
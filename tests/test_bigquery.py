@@ -204,17 +204,314 @@ def test_sql_builder():
     expected_query1 = """SELECT `name` FROM `clean2.new_table` WHERE `age` > @param_0"""
 
     query2, params2 = (
-        sql_builder.select("name")
+        sql_builder.reset()
+        .select("name")
         .where([("age", ">", 25), ("age", "<", 35)])
         .limit(10)
         .build()
     )
-    expected_query2 = """SELECT `name` FROM `clean2.new_table` WHERE `age` > @param_0 AND `age` < @param_1 LIMIT 10"""
+    # Filters are sorted by (column, operator) for byte-identical SQL
+    expected_query2 = """SELECT `name` FROM `clean2.new_table` WHERE `age` < @param_0 AND `age` > @param_1 LIMIT 10"""
 
     success[0] = query1 == expected_query1
     success[1] = params1 == {"param_0": 25}
     success[2] = query2 == expected_query2
-    success[3] = params2 == {"param_0": 25, "param_1": 35}
+    success[3] = params2 == {"param_0": 35, "param_1": 25}
+
+    query3, params3 = (
+        sql_builder.reset().select("name").where([("age", "IN", [25, 35])]).build()
+    )
+    expected_query3 = """SELECT `name` FROM `clean2.new_table` WHERE `age` IN (@param_0_0, @param_0_1)"""
+    success[4] = query3 == expected_query3
+    success[5] = params3 == {"param_0_0": 25, "param_0_1": 35}
+
+    # build() does not reset the builder; reset() does
+    success[6] = sql_builder.build() == (query3, params3)
+    success[7] = sql_builder.reset().build() == ("SELECT * FROM `clean2.new_table`", {})
+
+    # Long lists are bound as a single array parameter
+    values = list(range(40))
+    query4, params4 = sql_builder.reset().where([("age", "IN", values)]).build()
+    expected_query4 = """SELECT * FROM `clean2.new_table` WHERE `age` IN UNNEST(@param_0)"""
+    success[8] = query4 == expected_query4
+    success[9] = params4 == {"param_0": values}
+    cached = SQLBuilder.build_cached("clean2.new_table", None, [("age", "IN", values)])
+    success[10] = cached == (query4, params4)
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_sql_builder_build_cached():
+    from gcp_pal.bigquery import SQLBuilder
+
+    success = {}
+
+    filters = [("b", "in", list(range(12))), ("a", ">", 1)]
+    expected = (
+        SQLBuilder("clean2.new_table").select(["a", "b"]).where(filters).limit(5).build()
+    )
+    output = SQLBuilder.build_cached("clean2.new_table", ["a", "b"], filters, 5)
+    success[0] = output == expected
+
+    # Same shape, different values: the SQL is reused and only the parameters change
+    filters = [("a", ">", 2), ("b", "IN", list(range(100, 112)))]
+    hits = SQLBuilder.template.cache_info().hits
+    sql, params = SQLBuilder.build_cached("clean2.new_table", ["a", "b"], filters, 5)
+    success[1] = sql == expected[0]
+    success[2] = params["param_0"] == 2 and params["param_1_11"] == 111
+    success[3] = SQLBuilder.template.cache_info().hits == hits + 1
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_bq_param_type():
+    import datetime
+    from gcp_pal.bigquery import _bq_param_type
+
+    success = {}
+    success[0] = _bq_param_type(1) == "INT64"
+    success[1] = _bq_param_type(True) == "BOOL"
+    success[2] = _bq_param_type(1.5) == "FLOAT64"
+    success[3] = _bq_param_type("a") == "STRING"
+    success[4] = _bq_param_type(datetime.date(2024, 1, 1)) == "DATE"
+    success[5] = _bq_param_type(datetime.datetime(2024, 1, 1)) == "TIMESTAMP"
+    success[6] = _bq_param_type(object()) == "STRING"
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_append_rows_errors():
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock, patch
+    from google.api_core import exceptions
+
+    success = {}
+    row_errors = [SimpleNamespace(index=1, message="Missing required field: a.")]
+    bigquery_storage = MagicMock()
+    stream = bigquery_storage.writer.AppendRowsStream.return_value
+    stream.send.return_value.result.side_effect = exceptions.InvalidArgument(
+        "Bad rows", response=SimpleNamespace(row_errors=row_errors)
+    )
+    row_class = MagicMock()
+    row_class.return_value.SerializeToString.return_value = b"row"
+    with patch("gcp_pal.bigquery.ClientHandler"), patch(
+        "gcp_pal.bigquery.try_import", return_value=bigquery_storage
+    ), patch.object(
+        BigQuery, "_get_row_message", return_value=(row_class, None, set())
+    ), patch.object(
+        BigQuery, "_storage_write_min_rows", 1
+    ):
+        bq = BigQuery("project.dataset.table")
+        table = bigquery.Table("project.dataset.table")
+        errors = bq._append_rows(table, [{"a": 1}, {"b": 2}])
+        success[0] = errors == [{"index": 1, "errors": "Missing required field: a."}]
+        success[1] = stream.close.called
+        # Rejected rows are reported, so insert returns False instead of raising
+        success[2] = bq.insert([{"a": 1}, {"b": 2}]) is False
+        # Failures without row errors are left to the streaming insert API
+        stream.send.return_value.result.side_effect = exceptions.PermissionDenied("")
+        success[3] = bq._append_rows(table, [{"a": 1}]) is None
+        # Rows which do not fit in a single request are left to the streaming insert API
+        stream.send.reset_mock()
+        row_class.return_value.SerializeToString.return_value = b"x" * 5_000_000
+        success[4] = bq._append_rows(table, [{"a": 1}, {"a": 2}]) is None
+        success[5] = not stream.send.called
+    BigQuery._table_cache.pop("project.dataset.table", None)
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_storage_write_rows():
+    import datetime
+    import numpy as np
+    from unittest.mock import MagicMock, patch
+    from gcp_pal.bigquery import _storage_write_value
+
+    success = {}
+    success[0] = _storage_write_value("2024-01-01", True) == "2024-01-01"
+    success[1] = _storage_write_value(1.5, True) == "1.5"
+    success[2] = _storage_write_value(1, False) == 1
+    for i, value in enumerate([datetime.date(2024, 1, 1), np.int64(1)], start=3):
+        try:
+            _storage_write_value(value, True)
+            success[i] = False
+        except TypeError:
+            success[i] = True
+    with patch("gcp_pal.bigquery.ClientHandler"):
+        bq = BigQuery("project.dataset.table")
+    schema = [
+        bigquery.SchemaField("a", "INTEGER"),
+        bigquery.SchemaField("b", "DATE"),
+    ]
+    success[5] = bq._get_row_message(schema) is not None
+    # Not a valid proto field name
+    success[6] = bq._get_row_message([bigquery.SchemaField("a-b", "STRING")]) is None
+    # Datetimes are left to insert_rows_json, as they are for small batches
+    table = bigquery.Table("project.dataset.table", schema=schema)
+    rows = [{"a": 1, "b": datetime.date(2024, 1, 1)}]
+    with patch("gcp_pal.bigquery.try_import", return_value=MagicMock()):
+        success[7] = bq._append_rows(table, rows) is None
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_insert_rows_orjson():
+    import json
+    import datetime
+    from unittest.mock import patch
+
+    success = {}
+    with patch("gcp_pal.bigquery.ClientHandler"):
+        bq = BigQuery("project.dataset.table")
+    table = bigquery.Table("project.dataset.table")
+    response = bq.client._http.post.return_value
+    response.status_code = 200
+    response.json.return_value = {"insertErrors": [{"index": "1", "errors": ["x"]}]}
+    bq.client._connection.build_api_url.return_value = "https://bigquery/insertAll"
+    bq.client.insert_rows_json.return_value = []
+
+    rows = [{"a": i} for i in range(bq._orjson_min_rows + 1)]
+    errors = bq._insert_rows(table, rows)
+    success[0] = errors == [{"index": 1, "errors": ["x"]}]
+    bq.client._connection.build_api_url.assert_called_once_with(
+        path=f"{table.path}/insertAll"
+    )
+    _, kwargs = bq.client._http.post.call_args
+    body = json.loads(kwargs["data"])
+    success[1] = [row["json"] for row in body["rows"]] == rows
+    success[2] = all(row["insertId"] for row in body["rows"])
+    success[3] = not bq.client.insert_rows_json.called
+    # Values insert_rows_json cannot serialize are left to it, whatever the batch size
+    rows = [{"a": datetime.date(2024, 1, 1)}] * (bq._orjson_min_rows + 1)
+    success[4] = bq._insert_rows_orjson(table, rows) is None
+    success[5] = bq._insert_rows(table, rows) == []
+    success[6] = bq.client.insert_rows_json.called
+    # Failed requests raise, as they do from insert_rows_json
+    response.status_code = 400
+    response.json.return_value = {"error": {"message": "Invalid table"}}
+    try:
+        bq._insert_rows_orjson(table, [{"a": 1}])
+        success[7] = False
+    except bq.exceptions.BadRequest:
+        success[7] = True
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_read_to_parquet_empty(tmp_path):
+    import pyarrow.parquet as pq
+    from unittest.mock import patch
+
+    success = {}
+    with patch("gcp_pal.bigquery.ClientHandler"):
+        bq = BigQuery("project.dataset.table")
+    rows = bq.client.query_and_wait.return_value
+    rows.schema = [
+        bigquery.SchemaField("a", "INTEGER"),
+        bigquery.SchemaField("b", "STRING"),
+        bigquery.SchemaField("c", "TIMESTAMP"),
+    ]
+    rows.to_arrow_iterable.return_value = iter([])
+    path = str(tmp_path / "empty.parquet")
+    with patch.object(BigQuery, "_get_bqstorage_client", return_value=None):
+        n_rows = bq.read_to_parquet(path)
+    table = pq.read_table(path)
+    success[0] = n_rows == 0
+    success[1] = table.num_rows == 0
+    success[2] = table.column_names == ["a", "b", "c"]
+    success[3] = str(table.schema.field("c").type) == "timestamp[us, tz=UTC]"
+    # The started iterator is not read again
+    success[4] = not rows.to_arrow.called
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_infer_schema_cache():
+    from unittest.mock import patch
+
+    success = {}
+    with patch("gcp_pal.bigquery.ClientHandler"):
+        bq = BigQuery("project.dataset.table")
+    BigQuery._schema_cache.clear()
+    # Rows which only differ further down are not served a cached schema
+    nulls = [{"a": 1, "b": None}] * 20
+    bq._infer_schema(nulls)
+    fingerprint = (("a", int), ("b", type(None)))
+    success[0] = list(BigQuery._schema_cache) == [fingerprint]
+    with patch("gcp_pal.bigquery.Schema") as schema:
+        bq._infer_schema(nulls + [{"a": 2, "b": "x"}])
+        success[1] = schema.called
+    success[1] = success[1] and list(BigQuery._schema_cache) == [fingerprint]
+    BigQuery._schema_cache.clear()
+    rows = [{"a": 1, "b": "x"}] * 20
+    success[2] = bq._infer_schema(rows) == bq._infer_schema(rows)
+    success[3] = len(BigQuery._schema_cache) == 1
+    with patch.object(BigQuery, "_schema_cache_size", 2):
+        for row in [{"c": 1}, {"d": 1}, {"e": 1}]:
+            bq._infer_schema([row])
+        success[4] = len(BigQuery._schema_cache) == 2
+    BigQuery._schema_cache.clear()
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_delete_dataset_table_cache():
+    from unittest.mock import patch
+
+    success = {}
+    with patch("gcp_pal.bigquery.ClientHandler"):
+        bq = BigQuery(dataset="dataset", project="project")
+    BigQuery._table_cache.update(
+        {
+            "project.dataset.table1": (0, None),
+            "project.dataset.table2": (0, None),
+            "project.dataset_2.table1": (0, None),
+        }
+    )
+    bq.delete_dataset()
+    success[0] = "project.dataset.table1" not in BigQuery._table_cache
+    success[1] = "project.dataset.table2" not in BigQuery._table_cache
+    success[2] = "project.dataset_2.table1" in BigQuery._table_cache
+    BigQuery._table_cache.clear()
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_sql_builder_union_all():
+    from gcp_pal.bigquery import SQLBuilder
+
+    success = {}
+
+    query, params = (
+        SQLBuilder("clean2.new_table")
+        .union_all([[("age", ">", 25)], [("age", "IN", [30, 35])]], columns="name")
+        .build()
+    )
+    expected_query = (
+        "SELECT `name`, 0 AS __batch FROM `clean2.new_table` WHERE `age` > @b0_param_0"
+        " UNION ALL "
+        "SELECT `name`, 1 AS __batch FROM `clean2.new_table` WHERE `age` IN (@b1_param_0_0, @b1_param_0_1)"
+    )
+    success[0] = query == expected_query
+    success[1] = params == {"b0_param_0": 25, "b1_param_0_0": 30, "b1_param_0_1": 35}
 
     failed = [k for k, v in success.items() if not v]
 
@@ -1,4 +1,5 @@
 import json
+import numpy as np
 import pandas as pd
 from uuid import uuid4
 from google.cloud import firestore
@@ -141,6 +142,61 @@ def test_read_collection():
     assert not failed
 
 
+def test_read_many():
+    success = {}
+    collection_name = "test_read_many"
+    paths = [f"{collection_name}/test_document_{uuid4()}" for _ in range(3)]
+    for i, path in enumerate(paths):
+        Firestore(path).write({"a": i})
+    missing_path = f"{collection_name}/test_document_{uuid4()}"
+    output = Firestore().read_many(paths + [missing_path])
+    # Clean up
+    Firestore(collection_name).delete()
+    success[0] = len(output) == 4
+    success[1] = all(output[path] == {"a": i} for i, path in enumerate(paths))
+    success[2] = output[missing_path] is None
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
+def test_dataframe_to_dict():
+    success = {}
+    nan, inf = float("nan"), float("inf")
+    data = pd.DataFrame(
+        {
+            "a": [1.0, nan, inf],
+            "b": [1, None, "x"],
+            "c": pd.array([1, None, 3], dtype="Int64"),
+            "d": ["s", None, -inf],
+            "e": [1, 2, 3],
+        }
+    )
+    output = Firestore._dataframe_to_dict(data)
+    success[0] = output == json.loads(data.to_json())
+    success[1] = output["a"] == {"0": 1.0, "1": None, "2": None}
+    success[2] = output["e"] == {"0": 1, "1": 2, "2": 3}
+    # Dates and arrays in object columns keep the to_json encoding
+    from datetime import date
+
+    data = pd.DataFrame(
+        {
+            "a": [date(2024, 1, 1), None],
+            "b": [np.array([1.0, np.inf]), np.array([2.0])],
+            "c": ["x", None],
+        }
+    )
+    output = Firestore._dataframe_to_dict(data)
+    success[3] = output == json.loads(data.to_json())
+    success[4] = list(output) == ["a", "b", "c"]
+    success[5] = output["c"] == {"0": "x", "1": None}
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
 def test_exists():
     success = {}
 
@@ -1,15 +1,15 @@
 import pytest
 
-from gcp_pal.request import Request
+from gcp_pal.request import Request, _GzipJsonStream
 
 
 @pytest.fixture
 def mocker():
     from unittest.mock import patch
 
-    with patch("requests.get") as get, patch("requests.post") as post, patch(
-        "requests.put"
-    ) as put:
+    with patch("requests.Session.get") as get, patch(
+        "requests.Session.post"
+    ) as post, patch("requests.Session.put") as put:
         yield get, post, put
 
 
@@ -35,3 +35,72 @@ def test_request_put(mocker):
     r = Request("https://example.com")
     r.put(payload)
     put.assert_called_once_with("https://example.com", headers=r.headers, data=payload)
+
+
+def test_request_custom_headers(mocker):
+    get, post, put = mocker
+    payload = {"key": "value"}
+    r = Request("https://example.com")
+    headers = {**r.headers, "X-Custom": "value"}
+    r.post(payload, headers={"X-Custom": "value"})
+    post.assert_any_call("https://example.com", headers=headers, data=payload)
+    r.put(payload, headers={"X-Custom": "value"})
+    put.assert_called_once_with("https://example.com", headers=headers, data=payload)
+    r.post(payload, compress=True, headers={"X-Custom": "value"})
+    assert post.call_args.kwargs["headers"]["X-Custom"] == "value"
+
+
+def test_request_json_kwarg(mocker):
+    get, post, put = mocker
+    payload = {"key": "value"}
+    r = Request("https://example.com")
+    r.post(json=payload)
+    post.assert_any_call("https://example.com", headers=r.headers, json=payload)
+    r.put(json=payload)
+    put.assert_called_once_with("https://example.com", headers=r.headers, json=payload)
+
+
+def test_request_headers_mutable(mocker):
+    get, post, put = mocker
+    r = Request("https://example.com")
+    r.headers["X-Custom"] = "value"
+    r.get()
+    assert get.call_args.kwargs["headers"]["X-Custom"] == "value"
+
+
+def test_token_expiry():
+    import json
+    import base64
+
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": 1700000000}).encode())
+    token = f"header.{payload.decode().rstrip('=')}.signature"
+    assert Request._token_expiry(token) == 1700000000
+    assert Request._token_expiry("not-a-jwt") == 0
+    assert Request._token_expiry(None) == 0
+
+
+def test_compressed_body():
+    import gzip
+    import json
+
+    r = Request.__new__(Request)
+    r.orjson = None
+    small = {"key": "value"}
+    body, extra_headers = r._compressed_body(small)
+    assert json.loads(body) == small
+    assert extra_headers is None
+    large = {"key": "x" * 2000}
+    body, extra_headers = r._compressed_body(large)
+    assert json.loads(gzip.decompress(body)) == large
+    assert extra_headers == {"Content-Encoding": "gzip"}
+
+
+def test_gzip_json_stream():
+    import gzip
+    import json
+
+    payload = {"key": ["x" * 100] * 5000, "nested": {"a": 1}}
+    body = _GzipJsonStream(payload)
+    # The body can be iterated more than once, e.g. to resend it
+    for _ in range(2):
+        assert json.loads(gzip.decompress(b"".join(body))) == payload
@@ -6,10 +6,12 @@ from google.cloud import bigquery
 
 from gcp_pal.schema import (
     enforce_schema,
+    enforce_schema_on_series,
     infer_schema,
     Schema,
     compute_type_matches,
     get_equivalent_schema_dict,
+    get_equivalent_schema_type,
     get_matching_schema_type,
     dict_to_pyarrow_fields,
 )
@@ -54,6 +56,22 @@ def test_enforce_schema(data):
     assert not failed
 
 
+def test_enforce_schema_on_series_dict():
+    success = {}
+    series = pd.Series([1, 2, 3])
+    output = enforce_schema_on_series(series, {1: 10})
+    success[0] = output.tolist() == [10, 2, 3] and output.dtype == "int64"
+    output = enforce_schema_on_series(series, {})
+    success[1] = output.tolist() == [1, 2, 3] and output.dtype == "int64"
+    categories = pd.Series(["a", "b", "a"], dtype="category")
+    output = enforce_schema_on_series(categories, {"a": "c"})
+    success[2] = output.tolist() == ["c", "b", "c"] and output.dtype == "category"
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
 def test_infer_schema():
     success = {}
     data = {
@@ -95,6 +113,20 @@ def test_infer_schema():
     assert not failed
 
 
+def test_infer_schema_dtype_cache():
+    from gcp_pal.schema import _DTYPE_TO_STR
+
+    success = {}
+    for i in range(3):
+        data = pd.DataFrame({"a": [1, 2], "b": pd.Categorical([str(i), "x"])})
+        success[i] = infer_schema(data) == {"a": "int", "b": "category"}
+    success[3] = not any(str(dtype) == "category" for dtype in _DTYPE_TO_STR)
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
 def test_schema():
 
     success = {}
@@ -148,6 +180,24 @@ def test_schema():
     assert not failed
 
 
+def test_schema_conversion_cache():
+    success = {}
+    schema = Schema({"a": "int", "b": "str"}, schema_type="str")
+    fields = schema.bigquery()
+    fields.append(bigquery.SchemaField("c", "STRING"))
+    success[0] = len(schema.bigquery()) == 2
+    python_schema = schema.python()
+    python_schema["c"] = str
+    success[1] = schema.python() == {"a": int, "b": str}
+    schema.schema = {"a": "float"}
+    success[2] = schema.python() == {"a": float}
+    success[3] = [f.field_type for f in schema.bigquery()] == ["FLOAT"]
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
 def test_convert_all_schemas():
     success = {}
 
@@ -850,6 +900,12 @@ def test_compute_type_matches():
     matches = compute_type_matches(schema, target_schema)
     success[11] = matches == 1
 
+    # Repeated types each count as a match
+    schema = ["int", "int", "str"]
+    target_schema = get_equivalent_schema_dict("str").values()
+    matches = compute_type_matches(schema, target_schema)
+    success[12] = matches == 3
+
     failed = [k for k, v in success.items() if not v]
 
     assert not failed
@@ -885,3 +941,26 @@ def test_get_matching_schema_type():
     failed = [k for k, v in success.items() if not v]
 
     assert not failed
+
+
+def test_get_equivalent_schema_type():
+    success = {}
+
+    success[0] = get_equivalent_schema_type("int") == "INTEGER"
+    success[1] = get_equivalent_schema_type("str", target="python") == str
+    success[2] = get_equivalent_schema_type("INTEGER", direction="reverse") == "int"
+    success[3] = get_equivalent_schema_type(float, "python", "reverse") == "float"
+    # Repeated lookups are served from the cache
+    get_equivalent_schema_type.cache_clear()
+    get_equivalent_schema_type("int")
+    get_equivalent_schema_type("int")
+    success[4] = get_equivalent_schema_type.cache_info().hits == 1
+    try:
+        get_equivalent_schema_type("unknown")
+        success[5] = False
+    except ValueError:
+        success[5] = True
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
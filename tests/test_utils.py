@@ -275,6 +275,33 @@ def test_zip_directory():
     assert not failed
 
 
+def test_zip_directory_stream():
+    import os
+    import shutil
+    from zipfile import ZipFile
+    from gcp_pal.utils import zip_directory_stream
+
+    success = {}
+    dir_name = "test_dir_789"
+    file_name = "test_dir_012/test_file.txt"
+
+    os.makedirs(f"{dir_name}/test_dir_012", exist_ok=True)
+    with open(f"{dir_name}/{file_name}", "w") as f:
+        f.write("test")
+
+    buffer = zip_directory_stream(dir_name)
+    success[0] = not os.path.exists(f"{dir_name}.zip")
+    with ZipFile(buffer, "r") as z:
+        success[1] = z.namelist() == [file_name]
+        success[2] = z.read(file_name) == b"test"
+
+    shutil.rmtree(dir_name)
+
+    failed = [k for k, v in success.items() if not v]
+
+    assert not failed
+
+
 def test_module_handler():
     from gcp_pal.utils import ModuleHandler
 
@@ -349,6 +376,94 @@ def test_client_handler():
     assert len(ClientHandler._clients) == 3
 
 
+def test_client_handler_threads():
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from gcp_pal.utils import ClientHandler
+
+    created = []
+
+    def slow_client(**kwargs):
+        time.sleep(0.05)
+        created.append(kwargs)
+        return object()
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = [
+            executor.submit(ClientHandler(slow_client).get, project="p")
+            for _ in range(8)
+        ]
+        clients = [f.result() for f in futures]
+
+    assert len(created) == 1
+    assert all(c is clients[0] for c in clients)
+
+    # Different keys are built concurrently rather than one after another
+    start = time.time()
+    with ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(ClientHandler(slow_client).get, project=f"q{i}")
+            for i in range(4)
+        ]
+        [f.result() for f in futures]
+
+    assert len(created) == 5
+    assert time.time() - start < 0.15
+
+
+def test_log(capsys):
+    from gcp_pal.utils import log
+
+    log("Hello, %s!", "world")
+    log("Loading", "file.json")
+    log("50% done", 1)
+    output = capsys.readouterr().out.splitlines()
+
+    assert output == ["Hello, world!", "Loading file.json", "50% done 1"]
+
+
+def test_prefetch_pages():
+    from gcp_pal.utils import prefetch_pages
+
+    fetched = []
+
+    def pages():
+        for i in range(3):
+            fetched.append(i)
+            yield [i]
+
+    output = []
+    for page in prefetch_pages(pages()):
+        # The next page is requested before the current one is consumed
+        output.append((page, len(fetched)))
+
+    assert [p for p, _ in output] == [[0], [1], [2]]
+    assert all(n >= page[0] + 1 for page, n in output)
+
+
+def test_await_operation():
+    import asyncio
+    import pytest
+    from gcp_pal.utils import await_operation
+
+    class Operation:
+        def __init__(self, polls):
+            self.polls = polls
+
+        def done(self):
+            self.polls -= 1
+            return self.polls <= 0
+
+        def result(self):
+            return "deployed"
+
+    result = asyncio.run(await_operation(Operation(3), initial_delay=0.01))
+    assert result == "deployed"
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(await_operation(Operation(100), initial_delay=0.01, timeout=0.05))
+
+
 def test_lazy_loader():
     from gcp_pal.utils import LazyLoader
 